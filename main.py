@@ -1,10 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
+import sys
 import logging
 from pathlib import Path
 
-from term_extractor.api.routes import router as api_router
+from term_extractor.api.routes import router as api_router, get_pdf_extractor, get_term_db
+from term_extractor.core.pdf_extractor import shutdown_executor
 
 # Setup logging
 logging.basicConfig(
@@ -12,13 +18,28 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the tokenizer, encoder and indexes before serving (not at import,
+    # which spawned PDF workers repeat when they re-import this module)
+    await asyncio.to_thread(get_pdf_extractor)
+    await asyncio.to_thread(get_term_db)
+    yield
+    await asyncio.to_thread(shutdown_executor)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Construction Term Extractor API",
     description="API for extracting and searching construction industry terms from documents",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress large JSON responses (term lists, search results)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add CORS middleware for future web integration
 app.add_middleware(
     CORSMiddleware,
@@ -62,5 +83,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="warning"
     )
\ No newline at end of file
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class VectorSearchBatcher:
+    """
+    Coalesce concurrent vector searches into one encoder pass and one Faiss search.
+
+    Requests arriving within max_delay seconds of the first pending one (or until
+    max_batch_size is reached) are run together through search_batch, which takes
+    (queries, k) and returns one result list per query.
+    """
+
+    def __init__(
+        self,
+        search_batch: Callable[[List[str], int], List[List[Dict]]],
+        max_batch_size: int = 32,
+        max_delay: float = 0.01
+    ):
+        self.search_batch = search_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: List[Tuple[str, int, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def search(self, query: str, k: int) -> List[Dict]:
+        """Vector search for one query, batched with concurrent callers"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query, k, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, int, asyncio.Future]]):
+        queries = [query for query, _, _ in batch]
+        # One search with the largest k; smaller requests take the top of their row
+        k = max(k for _, k, _ in batch)
+        try:
+            # Encoding and Faiss search block, so they run in a worker thread
+            batch_results = await asyncio.to_thread(self.search_batch, queries, k)
+        except Exception as e:
+            logger.error(f"Batched vector search error: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, k, future), results in zip(batch, batch_results):
+            if not future.done():
+                future.set_result(results[:k])
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from pathlib import Path
+import asyncio
 from typing import List
 import logging
+import threading
 from datetime import datetime
 
 from ..core.pdf_extractor import PDFTermExtractor
 from ..core.term_database import TermDatabase
+from .batching import VectorSearchBatcher
 from .models import (
     SearchRequest, SearchResponse,
     ExtractRequest, ExtractResponse,
@@ -15,58 +19,105 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
-
-# Global instances
-pdf_extractor = PDFTermExtractor()
-term_db = TermDatabase()
-
-# Try to load existing database
-try:
-    term_db.load()
-    logger.info("Loaded existing term database")
-except:
-    logger.info("No existing database found")
-
-
-@router.post("/search", response_model=SearchResponse)
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared instances, built on first use so importing the app (including the
+# re-import in spawned PDF worker processes) does not load models or indexes
+_pdf_extractor = None
+_term_db = None
+_vector_batcher = None
+_init_lock = threading.Lock()
+
+
+def get_pdf_extractor() -> PDFTermExtractor:
+    global _pdf_extractor
+    if _pdf_extractor is None:
+        with _init_lock:
+            if _pdf_extractor is None:
+                _pdf_extractor = PDFTermExtractor()
+    return _pdf_extractor
+
+
+def get_term_db() -> TermDatabase:
+    global _term_db
+    if _term_db is None:
+        with _init_lock:
+            if _term_db is None:
+                term_db = TermDatabase()
+                # Try to load existing database
+                try:
+                    term_db.load()
+                    logger.info("Loaded existing term database")
+                except:
+                    logger.info("No existing database found")
+                _term_db = term_db
+    return _term_db
+
+
+def get_vector_batcher() -> VectorSearchBatcher:
+    """Concurrent vector/hybrid searches share one encoder pass and Faiss search"""
+    global _vector_batcher
+    if _vector_batcher is None:
+        with _init_lock:
+            if _vector_batcher is None:
+                _vector_batcher = VectorSearchBatcher(get_term_db().search_vector_batch)
+    return _vector_batcher
+
+
+def _term_payload(term: dict) -> dict:
+    """Project a stored term record onto the TermInfo fields"""
+    return {
+        'term': term['term'],
+        'category': term['category'],
+        'confidence': term['confidence'],
+        'frequency': term['frequency'],
+        'aliases': term.get('aliases', []),
+        'score': term.get('score')
+    }
+
+
+# Term lists are returned as plain dicts (records are validated when the
+# database is built); the response models only document the schema
+@router.post("/search", response_model=None, responses={200: {"model": SearchResponse}})
 async def search_terms(request: SearchRequest):
     """
     Search for construction terms in the database
     """
     try:
+        term_db = get_term_db()
         if request.search_type == "vector":
-            results = term_db.search_vector(request.query, request.limit)
+            results = await get_vector_batcher().search(request.query, request.limit)
         elif request.search_type == "text":
-            results = term_db.search_text(request.query, request.limit)
-        else:  # hybrid
-            results = term_db.hybrid_search(request.query, request.limit, request.alpha)
+            results = await asyncio.to_thread(term_db.search_text, request.query, request.limit)
+        else:  # hybrid (vector half batched, text half in parallel)
+            results = await term_db.hybrid_search_async(
+                request.query, request.limit, request.alpha,
+                vector_search=get_vector_batcher().search
+            )
         
-        # Convert to TermInfo models
-        term_infos = []
-        for result in results:
-            term_infos.append(TermInfo(**result))
+        term_infos = [_term_payload(result) for result in results]
         
-        return SearchResponse(
-            query=request.query,
-            results=term_infos,
-            count=len(term_infos),
-            search_type=request.search_type
-        )
+        return {
+            "query": request.query,
+            "results": term_infos,
+            "count": len(term_infos),
+            "search_type": request.search_type.value
+        }
     
     except Exception as e:
         logger.error(f"Search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/extract", response_model=ExtractResponse)
+@router.post("/extract", response_model=None, responses={200: {"model": ExtractResponse}})
 async def extract_terms(request: ExtractRequest):
     """
     Extract construction terms from provided text
     """
     try:
-        # Extract terms
-        raw_terms = pdf_extractor.extract_terms_from_text(request.text)
+        term_db = get_term_db()
+        # Extract terms (tokenization runs in a worker thread, off the event loop)
+        raw_terms = await asyncio.to_thread(get_pdf_extractor().extract_terms_from_text, request.text)
         
         # Filter by confidence
         filtered_terms = [
@@ -74,22 +125,21 @@ async def extract_terms(request: ExtractRequest):
             if term['confidence'] >= request.min_confidence
         ]
         
-        # Convert to TermInfo models
         term_infos = []
         for term in filtered_terms:
-            term_info = TermInfo(
-                term=term['term'],
-                category=pdf_extractor._categorize_term(term['term']),
-                confidence=term['confidence'],
-                frequency=term.get('frequency', 1),
-                aliases=pdf_extractor._generate_aliases(term['term'])
-            )
-            term_infos.append(term_info)
-        
-        return ExtractResponse(
-            terms=term_infos,
-            count=len(term_infos)
-        )
+            term_infos.append({
+                'term': term['term'],
+                'category': term_db._categorize_term(term['term']),
+                'confidence': term['confidence'],
+                'frequency': term.get('frequency', 1),
+                'aliases': term_db._generate_aliases(term['term']),
+                'score': None
+            })
+        
+        return {
+            "terms": term_infos,
+            "count": len(term_infos)
+        }
     
     except Exception as e:
         logger.error(f"Extraction error: {e}")
@@ -107,12 +157,17 @@ async def batch_extract(request: BatchExtractRequest, background_tasks: Backgrou
         if not pdf_folder.exists():
             raise HTTPException(status_code=400, detail="PDF folder not found")
         
+        # List the folder once; the count is reused for the statistics
+        pdf_files = await asyncio.to_thread(lambda: list(pdf_folder.glob("*.pdf")))
+        
         # Extract terms from PDFs
-        terms = pdf_extractor.extract_terms_from_pdfs(pdf_folder)
+        terms = await asyncio.to_thread(
+            get_pdf_extractor().extract_terms_from_pdfs, pdf_folder, pdf_files=pdf_files
+        )
         
-        # Get statistics
-        pdf_count = len(list(pdf_folder.glob("*.pdf")))
-        unique_terms = len(set(t['term'] for t in terms))
+        # Get statistics (extract_terms_from_pdfs returns one entry per term)
+        pdf_count = len(pdf_files)
+        unique_terms = len(terms)
         
         # Rebuild database if requested
         if request.rebuild_db and terms:
@@ -134,11 +189,10 @@ async def batch_extract(request: BatchExtractRequest, background_tasks: Backgrou
 
 
 def rebuild_database(terms: List[dict]):
-    """Background task to rebuild database"""
+    """Background task to add newly extracted terms to the database"""
     try:
-        global term_db
-        term_db.build_from_terms(terms)
-        logger.info("Database rebuilt successfully")
+        added = get_term_db().upsert_terms(terms)
+        logger.info(f"Database updated successfully ({added} new terms)")
     except Exception as e:
         logger.error(f"Database rebuild error: {e}")
 
@@ -149,13 +203,9 @@ async def get_database_info():
     Get information about the term database
     """
     try:
-        all_terms = term_db.get_all_terms()
-        
+        term_db = get_term_db()
         # Count by category
-        categories = {}
-        for term in all_terms:
-            cat = term.get('category', '一般')
-            categories[cat] = categories.get(cat, 0) + 1
+        categories = dict(term_db.category_counts())
         
         # Get last update time
         metadata_path = term_db.db_path / "metadata.json"
@@ -166,7 +216,7 @@ async def get_database_info():
             ).isoformat()
         
         return DatabaseInfo(
-            total_terms=len(all_terms),
+            total_terms=len(term_db.terms_table),
             categories=categories,
             last_updated=last_updated
         )
@@ -176,7 +226,7 @@ async def get_database_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/terms", response_model=List[TermInfo])
+@router.get("/terms", response_model=None, responses={200: {"model": List[TermInfo]}})
 async def list_terms(
     limit: int = 100,
     offset: int = 0,
@@ -186,21 +236,10 @@ async def list_terms(
     List all terms in the database with pagination
     """
     try:
-        all_terms = term_db.get_all_terms()
-        
-        # Filter by category if specified
-        if category:
-            all_terms = [t for t in all_terms if t.get('category') == category]
-        
-        # Apply pagination
-        paginated_terms = all_terms[offset:offset + limit]
-        
-        # Convert to TermInfo models
-        term_infos = []
-        for term in paginated_terms:
-            term_infos.append(TermInfo(**term))
+        # Filter by category and paginate on the term columns
+        paginated_terms = get_term_db().get_terms(offset, limit, category)
         
-        return term_infos
+        return [_term_payload(term) for term in paginated_terms]
     
     except Exception as e:
         logger.error(f"List terms error: {e}")
@@ -0,0 +1,450 @@
+"""
+App factory for the lightweight entrypoints (main_minimal.py, main_enhanced.py,
+main_simple.py). Each profile enables a subset of the endpoints below.
+"""
+from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, BackgroundTasks, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+import uvicorn
+import sys
+import io
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import List, Optional
+
+from .core.term_dictionary import (
+    CONSTRUCTION_TERMS, TERMS_STORAGE_FILE,
+    extract_terms_minimal, search_terms, simple_extract_terms,
+    iter_text_terms, iter_csv_terms, iter_markdown_terms,
+    add_term_to_dictionary, bulk_add_terms, delete_custom_term, category_counts,
+    is_default_term, term_counts,
+    load_custom_terms, save_custom_terms, warmup,
+)
+
+# Upload size limit
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+
+# Data models
+class ExtractRequest(BaseModel):
+    text: str
+    min_confidence: Optional[float] = 0.5
+
+class TermInfo(BaseModel):
+    term: str
+    confidence: float
+    category: str
+
+class ExtractResponse(BaseModel):
+    terms: List[TermInfo]
+    count: int
+
+class SimpleTermInfo(BaseModel):
+    term: str
+    confidence: float
+
+class SimpleExtractResponse(BaseModel):
+    terms: List[SimpleTermInfo]
+    count: int
+
+class SearchRequest(BaseModel):
+    query: str
+    limit: Optional[int] = 10
+
+class AddTermRequest(BaseModel):
+    term: str
+    category: str
+    aliases: Optional[List[str]] = []
+    confidence: Optional[float] = 0.9
+
+class UploadResponse(BaseModel):
+    message: str
+    processed_count: int
+    added_terms: List[str]
+    skipped_terms: List[str]
+
+class TermManagementResponse(BaseModel):
+    message: str
+    affected_count: int
+
+
+# Dictionary-based extraction and search (minimal and enhanced profiles)
+dictionary_router = APIRouter()
+
+@dictionary_router.post("/extract", response_model=None,
+                        responses={200: {"model": ExtractResponse}})
+async def extract_terms(request: ExtractRequest, http_request: Request):
+    """从文本中抽取建筑专门用语"""
+    try:
+        # 结果已是响应所需的结构，直接返回而不再逐条构造模型
+        terms = extract_terms_minimal(request.text, request.min_confidence)
+
+        return {
+            "terms": terms,
+            "count": len(terms)
+        }
+
+    except Exception as e:
+        error_label = http_request.app.state.error_labels["extract"]
+        raise HTTPException(status_code=500, detail=f"{error_label}: {str(e)}")
+
+@dictionary_router.post("/search")
+async def search_construction_terms(request: SearchRequest, http_request: Request):
+    """建筑专门用语检索"""
+    try:
+        results = search_terms(request.query, request.limit)
+
+        return {
+            "query": request.query,
+            "results": results,
+            "count": len(results)
+        }
+
+    except Exception as e:
+        error_label = http_request.app.state.error_labels["search"]
+        raise HTTPException(status_code=500, detail=f"{error_label}: {str(e)}")
+
+@dictionary_router.get("/terms", response_model=None)
+async def list_all_terms():
+    """显示全部登录的专门用语"""
+    terms = []
+    for term, info in CONSTRUCTION_TERMS.items():
+        terms.append({
+            "term": term,
+            "category": info["category"],
+            "aliases": info["aliases"]
+        })
+
+    return {
+        "terms": terms,
+        "count": len(terms)
+    }
+
+
+# File upload and term management (enhanced profile)
+management_router = APIRouter()
+
+_TERM_FILE_PARSERS = {
+    '.txt': iter_text_terms,
+    '.csv': iter_csv_terms,
+    '.md': iter_markdown_terms,
+}
+
+
+def _parse_terms_file(binary_file, file_extension: str) -> List[dict]:
+    """以流的方式边解码边解析，不把整个文件读入内存"""
+    stream = io.TextIOWrapper(binary_file, encoding='utf-8', newline='')
+    try:
+        return list(_TERM_FILE_PARSERS[file_extension](stream))
+    finally:
+        stream.detach()
+
+
+@management_router.post("/upload", response_model=UploadResponse)
+async def upload_terms_file(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+    """上传术语文件 (支持 .txt, .csv, .md 格式)"""
+    try:
+        # 检查文件类型
+        file_extension = Path(file.filename).suffix.lower()
+        if file_extension not in ['.txt', '.csv', '.md']:
+            raise HTTPException(
+                status_code=400,
+                detail="不支持的文件格式。请上传 .txt, .csv 或 .md 文件"
+            )
+
+        # 检查文件大小（上传内容已由框架暂存在临时文件中）
+        file.file.seek(0, io.SEEK_END)
+        if file.file.tell() > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail="文件过大，最大支持 10MB")
+        file.file.seek(0)
+
+        # 在工作线程中解析，不阻塞事件循环；词典只在事件循环中修改
+        parsed_terms = await asyncio.to_thread(_parse_terms_file, file.file, file_extension)
+        added_terms, skipped_terms = bulk_add_terms(parsed_terms)
+
+        # 在响应返回后保存到文件
+        background_tasks.add_task(save_custom_terms)
+
+        return UploadResponse(
+            message=f"成功处理 {file.filename}",
+            processed_count=len(added_terms) + len(skipped_terms),
+            added_terms=added_terms,
+            skipped_terms=skipped_terms
+        )
+
+    except HTTPException:
+        raise
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="文件编码错误，请使用UTF-8编码")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"文件处理错误: {str(e)}")
+
+@management_router.post("/terms/add", response_model=TermManagementResponse)
+async def add_single_term(request: AddTermRequest, background_tasks: BackgroundTasks):
+    """手动添加单个术语"""
+    try:
+        success = add_term_to_dictionary(
+            request.term,
+            request.category,
+            request.aliases
+        )
+
+        if success:
+            background_tasks.add_task(save_custom_terms)
+            return TermManagementResponse(
+                message=f"成功添加术语: {request.term}",
+                affected_count=1
+            )
+        else:
+            return TermManagementResponse(
+                message=f"术语已存在: {request.term}",
+                affected_count=0
+            )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"添加术语失败: {str(e)}")
+
+@management_router.delete("/terms/delete/{term}")
+async def delete_term(term: str, background_tasks: BackgroundTasks):
+    """删除术语"""
+    try:
+        if is_default_term(term):
+            return TermManagementResponse(
+                message=f"无法删除内置术语: {term}",
+                affected_count=0
+            )
+        elif delete_custom_term(term):
+            background_tasks.add_task(save_custom_terms)
+            return TermManagementResponse(
+                message=f"成功删除术语: {term}",
+                affected_count=1
+            )
+        else:
+            return TermManagementResponse(
+                message=f"术语不存在: {term}",
+                affected_count=0
+            )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"删除术语失败: {str(e)}")
+
+@management_router.get("/terms/stats", response_model=None)
+async def get_terms_stats():
+    """获取术语统计信息"""
+    default_terms, custom_terms = term_counts()
+    total_terms = default_terms + custom_terms
+
+    return {
+        "total_terms": total_terms,
+        "default_terms": default_terms,
+        "custom_terms": custom_terms,
+        "categories": dict(category_counts()),
+        "storage_file": TERMS_STORAGE_FILE
+    }
+
+@management_router.get("/upload/formats")
+async def get_supported_formats():
+    """获取支持的文件格式说明"""
+    return {
+        "supported_formats": [
+            {
+                "format": ".txt",
+                "description": "纯文本格式",
+                "example": "术语名|分类|别名1,别名2"
+            },
+            {
+                "format": ".csv",
+                "description": "CSV表格格式",
+                "columns": ["term", "category", "aliases"]
+            },
+            {
+                "format": ".md",
+                "description": "Markdown格式",
+                "features": ["支持标题作为分类", "支持列表和表格"]
+            }
+        ],
+        "encoding": "UTF-8",
+        "max_file_size": "10MB"
+    }
+
+
+# Regex-only extraction (simple profile)
+simple_router = APIRouter()
+
+@simple_router.post("/extract", response_model=None,
+                    responses={200: {"model": SimpleExtractResponse}})
+async def simple_extract(request: ExtractRequest):
+    """Extract terms from text using simple regex"""
+    try:
+        terms = simple_extract_terms(request.text)
+
+        return {
+            "terms": terms,
+            "count": len(terms)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+DEMO_TEXT = "本工事は鉄筋コンクリート造の建築物の基礎工事を含みます。RC構造で耐震性能を確保し、品質管理を徹底します。"
+
+# Per-profile metadata, routers and root/health/demo payloads
+PROFILES = {
+    "minimal": {
+        "title": "Minimal Term Extractor API",
+        "description": "超轻量级术语提取API - 专为Python 3.12优化",
+        "version": "1.0.0-minimal",
+        "routers": [dictionary_router],
+        "load_custom_terms": False,
+        "root": {
+            "message": "建築業界専門用語抽出API",
+            "version": "1.0.0-minimal",
+            "description": "Python 3.12対応・軽量版",
+            "features": [
+                "専門用語抽出",
+                "用語検索",
+                "カテゴリ分類"
+            ],
+            "endpoints": {
+                "extract": "/api/v1/extract",
+                "search": "/api/v1/search",
+                "list_terms": "/api/v1/terms"
+            }
+        },
+        "health": {"status": "healthy", "python_version": "3.12+"},
+        "demo_usage": "POST /api/v1/extract with {'text': 'your text here'}",
+        "error_labels": {"extract": "抽出エラー", "search": "検索エラー"},
+    },
+    "enhanced": {
+        "title": "Enhanced Term Extractor API",
+        "description": "建筑业专业术语抽取API - 支持文件上传和术语管理",
+        "version": "2.0.0-enhanced",
+        "routers": [dictionary_router, management_router],
+        "load_custom_terms": True,
+        "root": {
+            "message": "建築業界専門用語抽出API - Enhanced",
+            "version": "2.0.0-enhanced",
+            "description": "支持文件上传和术语管理的增强版",
+            "features": [
+                "专门用语抽取",
+                "用语检索",
+                "分类",
+                "文件上传 (txt/csv/md)",
+                "术语管理",
+                "与RAG系统集成"
+            ],
+            "endpoints": {
+                "extract": "/api/v1/extract",
+                "search": "/api/v1/search",
+                "list_terms": "/api/v1/terms",
+                "upload_file": "/api/v1/upload",
+                "add_term": "/api/v1/terms/add",
+                "delete_term": "/api/v1/terms/delete/{term}",
+                "stats": "/api/v1/terms/stats",
+                "formats": "/api/v1/upload/formats"
+            }
+        },
+        "health": {"status": "healthy", "python_version": "3.12+", "version": "enhanced"},
+        "demo_usage": {
+            "extract": "POST /api/v1/extract with {'text': 'your text here'}",
+            "upload": "POST /api/v1/upload with file upload",
+            "add_term": "POST /api/v1/terms/add with term data"
+        },
+        "error_labels": {"extract": "抽取错误", "search": "检索错误"},
+    },
+    "simple": {
+        "title": "Simple Term Extractor API",
+        "description": "Simplified API for term extraction without heavy NLP dependencies",
+        "version": "1.0.0-simple",
+        "routers": [simple_router],
+        "load_custom_terms": False,
+        "root": {
+            "message": "Simple Term Extractor API",
+            "version": "1.0.0-simple",
+            "note": "This is a simplified version with minimal dependencies"
+        },
+        "health": {"status": "healthy"},
+        "demo_usage": None,
+        "error_labels": {},
+    },
+}
+
+
+def create_app(profile: str = "minimal") -> FastAPI:
+    """Create the FastAPI app for one of the PROFILES"""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    config = PROFILES[profile]
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if config["load_custom_terms"]:
+            # 在工作进程启动时加载自定义术语（reload 模式下同样生效）
+            load_custom_terms()
+        # 在开始接受请求前构建索引并编译正则
+        warmup()
+        yield
+
+    app = FastAPI(
+        title=config["title"],
+        description=config["description"],
+        version=config["version"],
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
+    )
+    # 词典路由的错误信息沿用各版本原有的语言
+    app.state.error_labels = config["error_labels"]
+
+    # 压缩较大的响应（如 /api/v1/terms 的全部术语列表）
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    for router in config["routers"]:
+        app.include_router(router, prefix="/api/v1")
+
+    @app.get("/")
+    async def root():
+        return config["root"]
+
+    @app.get("/health")
+    async def health():
+        return config["health"]
+
+    if config["demo_usage"] is not None:
+        @app.get("/demo")
+        async def demo():
+            """デモ用サンプル"""
+            terms = extract_terms_minimal(DEMO_TEXT)
+
+            return {
+                "sample_text": DEMO_TEXT,
+                "extracted_terms": terms,
+                "usage": config["demo_usage"]
+            }
+
+    return app
+
+
+def run(app_path: str):
+    """Run one of the entrypoint apps with the shared uvicorn settings"""
+    uvicorn.run(
+        app_path,
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="warning"
+    )
@@ -1,26 +1,73 @@
 import pdfplumber
 import re
-from typing import List, Dict, Set
+import numpy as np
+from typing import List, Dict, Iterable, Iterator, Set
 from pathlib import Path
 from sudachipy import tokenizer, dictionary
+import functools
 import logging
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to a single regex alternation
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer input budget; Sudachi refuses inputs longer than 49149 bytes
+MAX_TOKENIZE_BYTES = 32768
+
+# A sentence runs up to and including 。 or a newline
+_SENTENCE_PATTERN = re.compile(r'[^。\n]*(?:[。\n]|$)')
+
+# Deleting every non-katakana run leaves only the katakana characters
+_NON_KATAKANA_PATTERN = re.compile(r'[^ァ-ヴ]+')
+_KATAKANA_FIRST, _KATAKANA_LAST = ord('ァ'), ord('ヴ')
+
+# From this length a vectorized code point comparison beats the regex
+_KATAKANA_NUMPY_MIN_LEN = 128
+
+
+def _count_katakana(text: str) -> int:
+    """Number of characters in ァ-ヴ"""
+    if len(text) >= _KATAKANA_NUMPY_MIN_LEN:
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        return int(np.count_nonzero(
+            (codepoints >= _KATAKANA_FIRST) & (codepoints <= _KATAKANA_LAST)
+        ))
+    return len(_NON_KATAKANA_PATTERN.sub('', text))
+
+
+def term_rank_key(term_info: Dict[str, any]):
+    """Ranking of extracted terms: frequency, then confidence (higher first)"""
+    return term_info['frequency'], term_info['confidence']
+
 
 class PDFTermExtractor:
     def __init__(self):
-        self.tokenizer_obj = dictionary.Dictionary().create()
+        self._dictionary = dictionary.Dictionary()
+        self._local = threading.local()
         self.mode = tokenizer.Tokenizer.SplitMode.C
         
         # Construction industry term patterns
         self.term_patterns = [
             r'[ァ-ヴ]{3,}',  # Katakana terms (3+ chars)
-            r'[一-龯]{2,}[工事|施工|構造|材料|設備|管理]',  # Kanji + construction suffix
+            r'[一-龯]{2,}(?:工事|施工|構造|材料|設備|管理)',  # Kanji + construction suffix
             r'[A-Z]{2,}',  # Abbreviations (RC, PC, etc.)
-            r'\d+[級|種|号|型]',  # Numbered classifications
+            r'\d+[級種号型]',  # Numbered classifications
         ]
         
+        # All patterns fused into one alternation so the text is scanned once
+        self._pattern_union = re.compile("|".join(
+            f"(?P<g{i}>{pattern})" for i, pattern in enumerate(self.term_patterns)
+        ))
+        
         # Common construction term components
         self.construction_keywords = {
             '工事', '施工', '構造', '材料', '設備', '管理', '基礎', '躯体',
@@ -28,43 +75,84 @@ class PDFTermExtractor:
             '鉄筋', 'コンクリート', '鋼材', '木材', '石材', 'タイル', 'ガラス',
             '建築', '土木', '設計', '監理', '検査', '試験', '品質', '安全'
         }
+        
+        # All keywords are found in one scan of the candidate term
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.construction_keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._has_keyword = lambda term: next(automaton.iter(term), None) is not None
+        else:
+            keyword_pattern = re.compile("|".join(map(re.escape, self.construction_keywords)))
+            self._has_keyword = lambda term: keyword_pattern.search(term) is not None
+        
+        # Number followed by a unit or classification suffix
+        self._unit_pattern = re.compile(r'\d+(?:mm|cm|m|kg|t|N|Pa|MPa|級|種|号)')
+        
+        # Noun phrases repeat across pages and documents
+        self._is_construction_term = functools.lru_cache(maxsize=100_000)(
+            self._is_construction_term
+        )
     
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract all text from PDF file"""
-        text = ""
+    @property
+    def tokenizer_obj(self):
+        """Sudachi tokenizer for the current thread (tokenizers cannot be shared)"""
+        tokenizer_obj = getattr(self._local, 'tokenizer_obj', None)
+        if tokenizer_obj is None:
+            tokenizer_obj = self._local.tokenizer_obj = self._dictionary.create()
+        return tokenizer_obj
+    
+    def iter_text_from_pdf(self, pdf_path: Path) -> Iterator[str]:
+        """Yield the text of each PDF page that has any"""
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        yield page_text
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
-        return text
+    
+    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+        """Extract all text from PDF file"""
+        return "".join(page_text + "\n" for page_text in self.iter_text_from_pdf(pdf_path))
+    
+    def extract_terms_from_pdf(self, pdf_path: Path) -> List[Dict[str, any]]:
+        """Extract terms from a PDF page by page"""
+        return list(self.iter_terms(self.iter_text_from_pdf(pdf_path)))
+    
+    def iter_terms(self, texts: Iterable[str]) -> Iterator[Dict[str, any]]:
+        """Extract terms from texts one at a time (first occurrence of each term wins)
+
+        texts may be lazy (pages, lines), so only one of them is held at once.
+        """
+        seen_terms = set()
+        for text in texts:
+            for term_info in self.extract_terms_from_text(text):
+                if term_info['term'] not in seen_terms:
+                    seen_terms.add(term_info['term'])
+                    yield term_info
     
     def extract_terms_from_text(self, text: str) -> List[Dict[str, any]]:
         """Extract construction terms from text"""
         terms = []
         seen_terms = set()
         
-        # Pattern-based extraction
-        for pattern in self.term_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if match not in seen_terms and len(match) >= 2:
-                    seen_terms.add(match)
-                    terms.append({
-                        'term': match,
-                        'type': 'pattern',
-                        'confidence': 0.7
-                    })
-        
-        # Morphological analysis extraction
-        tokens = self.tokenizer_obj.tokenize(text, self.mode)
-        
-        # Extract noun phrases
+        # Pattern-based extraction (single pass over the text)
+        for m in self._pattern_union.finditer(text):
+            match = m.group()
+            if match not in seen_terms and len(match) >= 2:
+                seen_terms.add(match)
+                terms.append({
+                    'term': match,
+                    'type': 'pattern',
+                    'confidence': 0.7
+                })
+        
+        # Morphological analysis extraction (noun phrases continue across chunks)
         current_phrase = []
-        for token in tokens:
+        for token in self._iter_tokens(text):
             pos = token.part_of_speech()[0]
             
             if pos == '名詞':
@@ -93,45 +181,99 @@ class PDFTermExtractor:
         
         return terms
     
+    def _iter_tokens(self, text: str):
+        """Tokenize text chunk by chunk (Sudachi rejects inputs over ~48KB)"""
+        for chunk in self._iter_chunks(text):
+            yield from self.tokenizer_obj.tokenize(chunk, self.mode)
+    
+    @staticmethod
+    def _iter_chunks(text: str, max_bytes: int = MAX_TOKENIZE_BYTES):
+        """Split text at 。/newline boundaries into chunks of at most max_bytes UTF-8 bytes"""
+        chunk = []
+        chunk_bytes = 0
+        for sentence in _SENTENCE_PATTERN.findall(text):
+            sentence_bytes = len(sentence.encode('utf-8'))
+            if chunk and chunk_bytes + sentence_bytes > max_bytes:
+                yield ''.join(chunk)
+                chunk, chunk_bytes = [], 0
+            
+            if sentence_bytes > max_bytes:
+                # A single over-long sentence is split by characters
+                for char in sentence:
+                    char_bytes = len(char.encode('utf-8'))
+                    if chunk_bytes + char_bytes > max_bytes:
+                        yield ''.join(chunk)
+                        chunk, chunk_bytes = [], 0
+                    chunk.append(char)
+                    chunk_bytes += char_bytes
+            else:
+                chunk.append(sentence)
+                chunk_bytes += sentence_bytes
+        
+        if chunk:
+            yield ''.join(chunk)
+    
+    def _process_pdf(self, pdf_path: Path) -> List[Dict[str, any]]:
+        """Extract terms from a single PDF"""
+        logger.info(f"Processing {pdf_path.name}")
+        return self.extract_terms_from_pdf(pdf_path)
+    
     def _is_construction_term(self, term: str) -> bool:
         """Check if term is likely construction-related"""
         # Check if term contains construction keywords
-        for keyword in self.construction_keywords:
-            if keyword in term:
-                return True
+        if self._has_keyword(term):
+            return True
         
         # Check if term is mostly katakana (foreign technical terms)
-        katakana_ratio = sum(1 for c in term if 'ァ' <= c <= 'ヴ') / len(term)
+        katakana_ratio = _count_katakana(term) / len(term)
         if katakana_ratio > 0.7:
             return True
         
         # Check if term contains numbers with units
-        if re.search(r'\d+[mm|cm|m|kg|t|N|Pa|MPa|級|種|号]', term):
+        if self._unit_pattern.search(term):
             return True
         
         return False
     
-    def extract_terms_from_pdfs(self, pdf_folder: Path) -> List[Dict[str, any]]:
-        """Extract terms from all PDFs in folder"""
+    def extract_terms_from_pdfs(self, pdf_folder: Path, max_workers: int = None,
+                                pdf_files: List[Path] = None,
+                                sort: bool = True) -> List[Dict[str, any]]:
+        """Extract terms from all PDFs in folder (one worker process per CPU)
+
+        pdf_files may be passed when the caller has already listed the folder.
+        The result holds one entry per unique term, ordered by term_rank_key
+        unless sort is False (callers that only need the top few can use
+        heapq.nlargest instead of a full sort).
+        """
         all_terms = []
-        term_frequency = {}
+        term_frequency = Counter()
         
-        pdf_files = list(pdf_folder.glob("*.pdf"))
+        if pdf_files is None:
+            pdf_files = list(pdf_folder.glob("*.pdf"))
         logger.info(f"Found {len(pdf_files)} PDF files")
         
-        for pdf_path in pdf_files:
-            logger.info(f"Processing {pdf_path.name}")
-            text = self.extract_text_from_pdf(pdf_path)
-            terms = self.extract_terms_from_text(text)
-            
-            # Count frequency
+        workers = min(max_workers or os.cpu_count() or 1, len(pdf_files))
+        if workers > 1:
+            executor = _get_executor(workers)
+            # Several files per task cut IPC round-trips for large folders,
+            # while ~4 tasks per worker keep the load balanced
+            chunksize = max(1, len(pdf_files) // (workers * 4))
+            try:
+                terms_per_pdf = list(executor.map(_process_one_pdf, pdf_files,
+                                                  chunksize=chunksize))
+            except BrokenProcessPool:
+                _discard_executor(executor)
+                raise
+        else:
+            terms_per_pdf = [self._process_pdf(pdf_path) for pdf_path in pdf_files]
+        
+        # Count frequency (files are merged in glob order)
+        for terms in terms_per_pdf:
             for term_info in terms:
                 term = term_info['term']
-                if term in term_frequency:
-                    term_frequency[term] += 1
-                else:
-                    term_frequency[term] = 1
+                if term not in term_frequency:
                     all_terms.append(term_info)
+                term_frequency[term] += 1
         
         # Add frequency information
         for term_info in all_terms:
@@ -141,6 +283,60 @@ class PDFTermExtractor:
                 term_info['confidence'] = min(1.0, term_info['confidence'] + 0.1)
         
         # Sort by frequency and confidence
-        all_terms.sort(key=lambda x: (x['frequency'], x['confidence']), reverse=True)
+        if sort:
+            all_terms.sort(key=term_rank_key, reverse=True)
         
-        return all_terms
\ No newline at end of file
+        return all_terms
+
+
+# Per-process extractor for extract_terms_from_pdfs worker processes
+_worker_extractor = None
+
+# Worker pool shared by every extract_terms_from_pdfs call, created on first use
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool, growing it when more workers are asked for"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers < workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            # spawn, not fork: the API calls this from a worker thread of a threaded server
+            _executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            mp_context=multiprocessing.get_context("spawn"))
+            _executor_workers = workers
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+            _executor_workers = 0
+    executor.shutdown(wait=False)
+
+
+def shutdown_executor() -> None:
+    """Stop the shared worker pool (e.g. on application shutdown)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        executor, _executor, _executor_workers = _executor, None, 0
+    if executor is not None:
+        executor.shutdown()
+
+
+def _init_worker():
+    """Load the Sudachi dictionary once per worker process"""
+    global _worker_extractor
+    _worker_extractor = PDFTermExtractor()
+
+
+def _process_one_pdf(pdf_path: Path) -> List[Dict[str, any]]:
+    """Extract terms from one PDF in a worker process"""
+    return _worker_extractor._process_pdf(pdf_path)
@@ -1,63 +1,379 @@
+import asyncio
+import functools
+import hashlib
+import heapq
 import json
+import os
 import pickle
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, Counter
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Awaitable, Callable, List, Dict, Iterable, Iterator, Optional, Tuple
 import numpy as np
+import orjson
 import faiss
+import torch
 from sentence_transformers import SentenceTransformer
-from whoosh import index, fields, qparser
-from whoosh.filedb.filestore import FileStorage
 import logging
 
+try:
+    import redis
+except ImportError:  # redis is optional; the in-process cache is always available
+    redis = None
+
 logger = logging.getLogger(__name__)
 
+# Redis server shared by all workers for query embeddings and search results
+# (unset: cache in process memory only)
+REDIS_URL = os.environ.get("TERM_DB_REDIS_URL")
+
+# Sentence transformer for Japanese
+ENCODER_MODEL = 'sonoisa/sentence-bert-base-ja-mean-tokens-v2'
+
+
+@functools.lru_cache(maxsize=1)
+def get_encoder() -> SentenceTransformer:
+    """Sentence transformer shared by every TermDatabase in the process"""
+    model = SentenceTransformer(ENCODER_MODEL)
+    if torch.cuda.is_available():
+        model.half()
+    else:
+        torch.set_float32_matmul_precision('high')
+    
+    # Warm up so the first request doesn't pay for lazy initialization
+    with torch.inference_mode():
+        model.encode(['warmup'], show_progress_bar=False)
+    return model
+
+
+def _replace_file(path: Path, write):
+    """Write path through a temporary file and rename it into place
+
+    Processes that memory-mapped the old file keep reading it instead of
+    crashing on a truncated mapping.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class TermsTable:
+    """Column store for term records; row i holds the term with id i
+
+    Numeric fields live in numpy arrays and strings in flat lists, so scans
+    such as category counting touch one column instead of a dict per term.
+    Dict records are only built for API responses.
+    """
+    STRINGS_FILE = "terms.json"
+    CONFIDENCES_FILE = "confidences.npy"
+    FREQUENCIES_FILE = "frequencies.npy"
+
+    terms: List[str] = field(default_factory=list)
+    aliases: List[List[str]] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    confidences: np.ndarray = field(default_factory=lambda: np.empty(0, dtype='float64'))
+    frequencies: np.ndarray = field(default_factory=lambda: np.empty(0, dtype='int32'))
+    contexts: List[str] = field(default_factory=list)
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, any]]) -> 'TermsTable':
+        """Build a table from term_data dicts (e.g. a legacy terms_data.pkl)"""
+        table = cls()
+        table.extend(records)
+        return table
+    
+    @classmethod
+    def load(cls, directory: Path) -> 'TermsTable':
+        """Load a saved table; numeric columns are memory-mapped read-only"""
+        strings = orjson.loads((directory / cls.STRINGS_FILE).read_bytes())
+        return cls(
+            terms=strings['terms'],
+            aliases=strings['aliases'],
+            categories=strings['categories'],
+            confidences=np.load(directory / cls.CONFIDENCES_FILE, mmap_mode='r'),
+            frequencies=np.load(directory / cls.FREQUENCIES_FILE, mmap_mode='r'),
+            contexts=strings['contexts']
+        )
+    
+    @classmethod
+    def exists(cls, directory: Path) -> bool:
+        return (directory / cls.STRINGS_FILE).exists()
+    
+    def save(self, directory: Path):
+        """Save the string columns as JSON and the numeric columns as .npy"""
+        def save_array(array):
+            def write(path):
+                with open(path, 'wb') as f:
+                    np.save(f, array)
+            return write
+        
+        _replace_file(directory / self.CONFIDENCES_FILE, save_array(self.confidences))
+        _replace_file(directory / self.FREQUENCIES_FILE, save_array(self.frequencies))
+        strings = orjson.dumps({
+            'terms': self.terms,
+            'aliases': self.aliases,
+            'categories': self.categories,
+            'contexts': self.contexts
+        })
+        _replace_file(directory / self.STRINGS_FILE, lambda path: path.write_bytes(strings))
+    
+    def copy(self) -> 'TermsTable':
+        """Independent copy (numeric columns are read into memory)"""
+        return TermsTable(
+            terms=list(self.terms),
+            aliases=list(self.aliases),
+            categories=list(self.categories),
+            confidences=np.array(self.confidences),
+            frequencies=np.array(self.frequencies),
+            contexts=list(self.contexts)
+        )
+    
+    def make_writable(self):
+        """Copy memory-mapped columns into memory before modifying them"""
+        if not self.confidences.flags.writeable:
+            self.confidences = np.array(self.confidences)
+        if not self.frequencies.flags.writeable:
+            self.frequencies = np.array(self.frequencies)
+    
+    def __len__(self) -> int:
+        return len(self.terms)
+    
+    def extend(self, records: Iterable[Dict[str, any]]):
+        """Append term_data dicts as new rows"""
+        records = list(records)
+        self.terms.extend(r['term'] for r in records)
+        self.aliases.extend(list(r.get('aliases', [])) for r in records)
+        self.categories.extend(r.get('category', '一般') for r in records)
+        self.contexts.extend(r.get('context', '') for r in records)
+        self.confidences = np.concatenate([
+            self.confidences,
+            np.fromiter((r.get('confidence', 0.8) for r in records), dtype='float64', count=len(records))
+        ])
+        self.frequencies = np.concatenate([
+            self.frequencies,
+            np.fromiter((r.get('frequency', 1) for r in records), dtype='int32', count=len(records))
+        ])
+    
+    def record(self, idx: int) -> Dict[str, any]:
+        """Row idx as a term_data dict"""
+        return {
+            'id': idx,
+            'term': self.terms[idx],
+            'aliases': list(self.aliases[idx]),
+            'category': self.categories[idx],
+            'confidence': float(self.confidences[idx]),
+            'frequency': int(self.frequencies[idx]),
+            'context': self.contexts[idx]
+        }
+    
+    def records(self, indexes: Optional[Iterable[int]] = None) -> Iterator[Dict[str, any]]:
+        """Rows as term_data dicts (all rows when indexes is None)"""
+        if indexes is None:
+            indexes = range(len(self))
+        return (self.record(idx) for idx in indexes)
+
+
+@dataclass(frozen=True)
+class _SearchState:
+    """Everything searches read; replaced as a whole, never modified in place
+
+    Writers build a new state next to the live one and publish it with a
+    single attribute assignment, so searches running in other threads keep
+    a consistent view without taking a lock.
+    """
+    faiss_index: Optional[faiss.Index] = None
+    terms_table: TermsTable = field(default_factory=TermsTable)
+    term_index: Dict[str, int] = field(default_factory=dict)  # term -> row in terms_table
+    faiss_index_mapped: bool = False  # IVF index with read-only memory-mapped lists
+
 
 class TermDatabase:
+    # Number of terms encoded per forward pass when building the database
+    ENCODE_BATCH_SIZE = 128
+    
+    # HNSW graph parameters for the Faiss vector index
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+    
+    # Vector compression by database size: full vectors below SQ_MIN_TERMS,
+    # int8 scalar quantization (SQ8) up to IVFPQ_MIN_TERMS, product
+    # quantization in an inverted file above
+    SQ_MIN_TERMS = 1000
+    IVFPQ_MIN_TERMS = 100_000
+    IVF_NLIST = 1024
+    IVF_NPROBE = 16
+    PQ_M = 64
+    
+    # Category keywords, checked in order (the first matching category wins)
+    CATEGORY_KEYWORDS = {
+        '構造': ['鉄筋', 'コンクリート', '鉄骨', '基礎', '柱', '梁', '耐震'],
+        '設備': ['空調', '給排水', '電気', '配管', '配線', '消防'],
+        '仕上げ': ['塗装', 'タイル', 'クロス', '床', '天井', '壁'],
+        '材料': ['セメント', '鋼材', '木材', '石材', 'ガラス'],
+        '施工': ['工事', '施工', '工程', '現場', '作業'],
+        '管理': ['品質', '安全', '工程', '検査', '試験']
+    }
+    
+    # Query cache: embeddings rarely change, search results only live briefly
+    EMBEDDING_CACHE_TTL = 3600
+    RESULT_CACHE_TTL = 60
+    LOCAL_CACHE_SIZE = 4096
+    
     def __init__(self, db_path: Path = Path("./data/term_db")):
         self.db_path = db_path
         self.db_path.mkdir(parents=True, exist_ok=True)
         
         # Initialize sentence transformer for Japanese
-        self.encoder = SentenceTransformer('sonoisa/sentence-bert-base-ja-mean-tokens-v2')
+        self.encoder = get_encoder()
         
-        # Initialize Faiss index
+        # Faiss index and term columns (see _SearchState); writers are serialized
         self.vector_dim = 768  # Dimension of the sentence transformer
-        self.faiss_index = None
-        self.terms_data = []
-        
-        # Initialize Whoosh index
-        self.whoosh_index = None
-        self._setup_whoosh_index()
-    
-    def _setup_whoosh_index(self):
-        """Setup Whoosh full-text search index"""
-        schema = fields.Schema(
-            id=fields.ID(stored=True),
-            term=fields.TEXT(stored=True, analyzer=fields.SimpleAnalyzer()),
-            aliases=fields.TEXT(stored=True),
-            category=fields.TEXT(stored=True),
-            context=fields.TEXT(stored=True)
-        )
+        self._state = _SearchState()
+        self._write_lock = threading.RLock()
         
-        index_path = self.db_path / "whoosh_index"
-        if not index_path.exists():
-            index_path.mkdir()
-            self.whoosh_index = index.create_in(str(index_path), schema)
-        else:
-            self.whoosh_index = index.open_dir(str(index_path))
+        # Initialize SQLite FTS5 full-text index (rowid = term id)
+        self.fts_path = self.db_path / "terms_fts.db"
+        self._local = threading.local()
+        self._setup_fts_index()
+        
+        # Query cache (Redis when configured, otherwise an in-process LRU)
+        self._redis = None
+        if REDIS_URL:
+            if redis is None:
+                logger.warning("redis is not installed, caching queries in process")
+            else:
+                self._redis = redis.Redis.from_url(REDIS_URL, decode_responses=False)
+        self._local_cache = OrderedDict()
+        self._local_cache_lock = threading.Lock()
+        self._cache_version = b""
+        
+        # One compiled alternation per category; terms recur across builds
+        self._category_patterns = [
+            (category, re.compile("|".join(map(re.escape, keywords))))
+            for category, keywords in self.CATEGORY_KEYWORDS.items()
+        ]
+        self._categorize_term = functools.lru_cache(maxsize=200_000)(self._categorize_term)
+    
+    @property
+    def faiss_index(self) -> Optional[faiss.Index]:
+        return self._state.faiss_index
+    
+    @property
+    def terms_table(self) -> TermsTable:
+        return self._state.terms_table
+    
+    @property
+    def fts_conn(self) -> sqlite3.Connection:
+        """SQLite connection for the current thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.fts_path))
+            self._local.conn = conn
+        return conn
+    
+    def _setup_fts_index(self):
+        """Setup SQLite FTS5 full-text search index"""
+        with self.fts_conn as conn:
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS terms_fts "
+                "USING fts5(term, aliases, category, context, "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+    
+    def _insert_fts_rows(self, fts_rows: Iterable[Tuple], replace_all: bool = False):
+        """Write (rowid, term, aliases, category, context) rows in a single transaction
+
+        With replace_all the existing rows are deleted in the same transaction.
+        """
+        with self.fts_conn as conn:
+            if replace_all:
+                conn.execute("DELETE FROM terms_fts")
+            conn.executemany(
+                "INSERT INTO terms_fts (rowid, term, aliases, category, context) "
+                "VALUES (?, ?, ?, ?, ?)",
+                fts_rows
+            )
+    
+    def _backfill_fts_index(self):
+        """Index the loaded terms when the full-text table is empty
+
+        Databases migrated from terms_data.pkl come without terms_fts.db.
+        """
+        terms_table = self.terms_table
+        if not len(terms_table):
+            return
+        (count,) = self.fts_conn.execute("SELECT count(*) FROM terms_fts").fetchone()
+        if count:
+            return
+        logger.info(f"Rebuilding full-text index for {len(terms_table)} terms")
+        self._insert_fts_rows(
+            (term_data['id'], term_data['term'], ' '.join(term_data['aliases']),
+             term_data['category'], term_data['context'])
+            for term_data in terms_table.records()
+        )
     
     def build_from_terms(self, terms: List[Dict[str, any]]):
         """Build database from extracted terms"""
         logger.info(f"Building database from {len(terms)} terms")
         
-        # Initialize Faiss index
-        self.faiss_index = faiss.IndexFlatL2(self.vector_dim)
+        # The Faiss index is created once the vectors are known (see _add_terms);
+        # searches keep using the old state until the new one is published
+        with self._write_lock:
+            self._add_terms(_SearchState(), terms, replace_all=True)
         
-        # Prepare data
-        writer = self.whoosh_index.writer()
-        vectors = []
+        logger.info("Database built successfully")
+    
+    def upsert_terms(self, terms: List[Dict[str, any]]) -> int:
+        """Add terms not yet in the database, encoding only those
+
+        Frequency and confidence of terms that are already present are
+        updated as well. Returns the number of newly added terms.
+        """
+        with self._write_lock:
+            state = self._state
+            if state.faiss_index is None or state.faiss_index.metric_type != faiss.METRIC_INNER_PRODUCT:
+                # No index yet, or one saved before the HNSW switch: rebuild
+                all_terms = {t['term']: t for t in state.terms_table.records()}
+                for term_info in terms:
+                    all_terms[term_info['term']] = term_info
+                added = len(all_terms) - len(state.term_index)
+                self.build_from_terms(list(all_terms.values()))
+                return added
+            
+            new_terms = {}
+            terms_table = state.terms_table.copy()
+            for term_info in terms:
+                idx = state.term_index.get(term_info['term'])
+                if idx is not None:
+                    if 'confidence' in term_info:
+                        terms_table.confidences[idx] = term_info['confidence']
+                    if 'frequency' in term_info:
+                        terms_table.frequencies[idx] = term_info['frequency']
+                else:
+                    new_terms.setdefault(term_info['term'], term_info)
+            
+            logger.info(f"Upserting {len(terms)} terms ({len(new_terms)} new)")
+            self._add_terms(replace(state, terms_table=terms_table), list(new_terms.values()))
+            return len(new_terms)
+    
+    def _add_terms(self, state: _SearchState, terms: List[Dict[str, any]],
+                   replace_all: bool = False):
+        """Append terms to state and publish it with the Faiss and full-text indexes
+
+        state.terms_table must not be shared with the live state; the Faiss
+        index is copied before terms are added to it.
+        """
+        records = []
+        fts_rows = []
+        surfaces = []
         
-        for idx, term_info in enumerate(terms):
+        for idx, term_info in enumerate(terms, start=len(state.terms_table)):
             # Enhance term data
             term_data = {
                 'id': idx,
@@ -69,32 +385,176 @@ class TermDatabase:
                 'context': ''  # Can be enhanced with surrounding text
             }
             
-            self.terms_data.append(term_data)
-            
-            # Generate vector embedding
-            vector = self.encoder.encode(term_data['term'])
-            vectors.append(vector)
+            records.append(term_data)
+            surfaces.append(term_data['term'])
             
-            # Add to Whoosh index
-            writer.add_document(
-                id=str(idx),
-                term=term_data['term'],
-                aliases=' '.join(term_data['aliases']),
-                category=term_data['category'],
-                context=term_data['context']
-            )
+            fts_rows.append((
+                idx,
+                term_data['term'],
+                ' '.join(term_data['aliases']),
+                term_data['category'],
+                term_data['context']
+            ))
+        
+        # Generate vector embeddings in batches and add them to Faiss
+        faiss_index = state.faiss_index
+        faiss_index_mapped = state.faiss_index_mapped
+        if surfaces:
+            with torch.inference_mode():
+                vectors_np = np.asarray(self.encoder.encode(
+                    surfaces,
+                    batch_size=self.ENCODE_BATCH_SIZE,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                ), dtype='float32')
+            faiss.normalize_L2(vectors_np)
+            if faiss_index is None:
+                faiss_index = self._create_faiss_index(vectors_np)
+            elif faiss_index_mapped:
+                # Memory-mapped inverted lists are read-only; load a private copy
+                faiss_index = faiss.read_index(str(self.db_path / "faiss.index"))
+                self._set_search_params(faiss_index)
+                faiss_index_mapped = False
+            else:
+                # Adding to an index that is being searched is not thread-safe
+                faiss_index = faiss.clone_index(faiss_index)
+                self._set_search_params(faiss_index)
+            faiss_index.add(vectors_np)
         
-        # Add vectors to Faiss
-        vectors_np = np.array(vectors).astype('float32')
-        self.faiss_index.add(vectors_np)
+        terms_table = state.terms_table
+        terms_table.extend(records)
         
-        # Commit Whoosh changes
-        writer.commit()
+        # Row ids only grow on upsert, so searches that read the new rows
+        # before the state is published skip them (idx < len(terms_table))
+        self._insert_fts_rows(fts_rows, replace_all=replace_all)
+        self._state = _SearchState(
+            faiss_index, terms_table, self._build_term_index(terms_table), faiss_index_mapped
+        )
         
         # Save database
         self.save()
+        self._invalidate_results()
+    
+    def _create_faiss_index(self, vectors: np.ndarray):
+        """Create and train an inner-product index sized for vectors
+
+        Vectors are L2-normalized, so the inner product is the cosine
+        similarity. Quantizers are trained on the initial vectors; terms
+        upserted later are encoded with the same parameters.
+        """
+        if len(vectors) >= self.IVFPQ_MIN_TERMS:
+            quantizer = faiss.IndexFlatIP(self.vector_dim)
+            index = faiss.IndexIVFPQ(
+                quantizer, self.vector_dim, self.IVF_NLIST, self.PQ_M, 8,
+                faiss.METRIC_INNER_PRODUCT
+            )
+        elif len(vectors) >= self.SQ_MIN_TERMS:
+            index = faiss.IndexHNSWSQ(
+                self.vector_dim, faiss.ScalarQuantizer.QT_8bit, self.HNSW_M,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+        else:
+            index = faiss.IndexHNSWFlat(
+                self.vector_dim, self.HNSW_M, faiss.METRIC_INNER_PRODUCT
+            )
+            index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
         
-        logger.info("Database built successfully")
+        if not index.is_trained:
+            index.train(vectors)
+        self._set_search_params(index)
+        return index
+    
+    def _set_search_params(self, index):
+        """Apply the query-time search parameters to a Faiss index"""
+        if hasattr(index, 'hnsw'):
+            index.hnsw.efSearch = self.HNSW_EF_SEARCH
+        if hasattr(index, 'nprobe'):
+            index.nprobe = self.IVF_NPROBE
+    
+    @staticmethod
+    def _build_term_index(terms_table: TermsTable) -> Dict[str, int]:
+        """Build the term -> row lookup (first entry wins on duplicates)"""
+        term_index = {}
+        for idx, term in enumerate(terms_table.terms):
+            term_index.setdefault(term, idx)
+        return term_index
+    
+    def _cache_get(self, key: bytes) -> Optional[bytes]:
+        """Look up a cached value"""
+        if self._redis is not None:
+            try:
+                return self._redis.get(key)
+            except redis.RedisError as e:
+                logger.warning(f"Redis cache unavailable: {e}")
+        
+        with self._local_cache_lock:
+            entry = self._local_cache.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires < time.monotonic():
+                del self._local_cache[key]
+                return None
+            self._local_cache.move_to_end(key)
+            return value
+    
+    def _cache_set(self, key: bytes, value: bytes, ttl: int):
+        """Store a value in the cache for ttl seconds"""
+        if self._redis is not None:
+            try:
+                self._redis.setex(key, ttl, value)
+                return
+            except redis.RedisError as e:
+                logger.warning(f"Redis cache unavailable: {e}")
+        
+        with self._local_cache_lock:
+            self._local_cache[key] = (value, time.monotonic() + ttl)
+            self._local_cache.move_to_end(key)
+            if len(self._local_cache) > self.LOCAL_CACHE_SIZE:
+                self._local_cache.popitem(last=False)
+    
+    def _invalidate_results(self):
+        """Stop serving cached search results after the terms change
+
+        The version is derived from the saved terms file, so workers sharing
+        the database directory also share cached results.
+        """
+        terms_path = self.db_path / TermsTable.STRINGS_FILE
+        stat = terms_path.stat() if terms_path.exists() else None
+        self._cache_version = hashlib.blake2b(
+            f"{terms_path.resolve()}:{stat and stat.st_mtime_ns}:{stat and stat.st_size}".encode('utf-8'),
+            digest_size=8
+        ).hexdigest().encode()
+    
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Encode queries, reusing cached embeddings and batching the misses"""
+        keys = [
+            b"emb:" + hashlib.blake2b(query.encode('utf-8'), digest_size=16).digest()
+            for query in queries
+        ]
+        vectors = [None] * len(queries)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                vectors[i] = np.frombuffer(cached, dtype='float32')
+            else:
+                misses.append(i)
+        
+        if misses:
+            with torch.inference_mode():
+                encoded = np.asarray(
+                    self.encoder.encode([queries[i] for i in misses],
+                                        convert_to_numpy=True, show_progress_bar=False),
+                    dtype='float32'
+                ).reshape(len(misses), -1)
+            for i, vector in zip(misses, encoded):
+                vectors[i] = vector
+                self._cache_set(keys[i], vector.tobytes(), self.EMBEDDING_CACHE_TTL)
+        
+        # np.vstack copies, so cached buffers are never normalized in place
+        return np.vstack(vectors)
     
     def _generate_aliases(self, term: str) -> List[str]:
         """Generate possible aliases for a term"""
@@ -120,117 +580,189 @@ class TermDatabase:
     
     def _categorize_term(self, term: str) -> str:
         """Categorize construction term"""
-        categories = {
-            '構造': ['鉄筋', 'コンクリート', '鉄骨', '基礎', '柱', '梁', '耐震'],
-            '設備': ['空調', '給排水', '電気', '配管', '配線', '消防'],
-            '仕上げ': ['塗装', 'タイル', 'クロス', '床', '天井', '壁'],
-            '材料': ['セメント', '鋼材', '木材', '石材', 'ガラス'],
-            '施工': ['工事', '施工', '工程', '現場', '作業'],
-            '管理': ['品質', '安全', '工程', '検査', '試験']
-        }
-        
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                if keyword in term:
-                    return category
+        for category, pattern in self._category_patterns:
+            if pattern.search(term):
+                return category
         
         return '一般'
     
     def search_vector(self, query: str, k: int = 10) -> List[Dict[str, any]]:
         """Search using vector similarity"""
-        if self.faiss_index is None:
-            return []
+        return self.search_vector_batch([query], k)[0]
+    
+    def search_vector_batch(self, queries: List[str], k: int = 10) -> List[List[Dict[str, any]]]:
+        """Search several queries with one encoder pass and one Faiss search"""
+        state = self._state
+        if state.faiss_index is None or not queries:
+            return [[] for _ in queries]
         
-        # Encode query
-        query_vector = self.encoder.encode(query).astype('float32').reshape(1, -1)
+        # Encode queries
+        query_vectors = self._encode_queries(queries)
+        cosine = state.faiss_index.metric_type == faiss.METRIC_INNER_PRODUCT
+        if cosine:
+            faiss.normalize_L2(query_vectors)
         
         # Search
-        distances, indices = self.faiss_index.search(query_vector, k)
+        distances, indices = state.faiss_index.search(query_vectors, k)
         
-        results = []
-        for idx, distance in zip(indices[0], distances[0]):
-            if idx < len(self.terms_data):
-                result = self.terms_data[idx].copy()
-                result['score'] = float(1 / (1 + distance))  # Convert distance to similarity
-                results.append(result)
+        batch_results = []
+        for row_indices, row_distances in zip(indices, distances):
+            results = []
+            for idx, distance in zip(row_indices, row_distances):
+                # Faiss pads with -1 when fewer than k vectors are found
+                if 0 <= idx < len(state.terms_table):
+                    result = state.terms_table.record(idx)
+                    if cosine:
+                        result['score'] = float(distance)
+                    else:
+                        # Indexes saved before the HNSW switch use L2 distance
+                        result['score'] = float(1 / (1 + distance))
+                    results.append(result)
+            batch_results.append(results)
         
-        return results
+        return batch_results
     
     def search_text(self, query: str, limit: int = 10) -> List[Dict[str, any]]:
         """Search using full-text search"""
-        results = []
+        # Every query word must match in one of the searched fields; words are
+        # quoted so FTS5 operators in user input are matched literally
+        words = query.split()
+        if not words:
+            return []
+        match = '{term aliases category} : ' + ' '.join(
+            '"' + word.replace('"', '""') + '"' for word in words
+        )
         
-        with self.whoosh_index.searcher() as searcher:
-            # Search in multiple fields
-            query_parser = qparser.MultifieldParser(
-                ["term", "aliases", "category"], 
-                self.whoosh_index.schema
-            )
-            q = query_parser.parse(query)
-            
-            search_results = searcher.search(q, limit=limit)
-            
-            for hit in search_results:
-                idx = int(hit['id'])
-                if idx < len(self.terms_data):
-                    result = self.terms_data[idx].copy()
-                    result['score'] = hit.score
-                    results.append(result)
+        terms_table = self.terms_table
+        rows = self.fts_conn.execute(
+            "SELECT rowid, bm25(terms_fts) AS rank FROM terms_fts "
+            "WHERE terms_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit)
+        ).fetchall()
+        
+        results = []
+        for idx, rank in rows:
+            if idx < len(terms_table):
+                result = terms_table.record(idx)
+                # bm25() is lower-is-better; flip it so higher scores rank first
+                result['score'] = -rank
+                results.append(result)
         
         return results
     
     def hybrid_search(self, query: str, k: int = 10, alpha: float = 0.5) -> List[Dict[str, any]]:
-        """Hybrid search combining vector and text search"""
-        # Get results from both methods
-        vector_results = self.search_vector(query, k * 2)
-        text_results = self.search_text(query, k * 2)
+        """Hybrid search combining vector and text search
+
+        Results are cached for RESULT_CACHE_TTL seconds per (query, k, alpha).
+        """
+        return self.hybrid_search_batch([query], k, alpha)[0]
+    
+    def hybrid_search_batch(self, queries: List[str], k: int = 10,
+                            alpha: float = 0.5) -> List[List[Dict[str, any]]]:
+        """Hybrid search for several queries with one encoder pass and one Faiss search"""
+        cache_keys = [self._hybrid_cache_key(query, k, alpha) for query in queries]
+        batch_results = [None] * len(queries)
+        misses = []
+        for i, cache_key in enumerate(cache_keys):
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                batch_results[i] = orjson.loads(cached)
+            else:
+                misses.append(i)
+        
+        if misses:
+            # Get results from both methods
+            vector_batch = self.search_vector_batch([queries[i] for i in misses], k * 2)
+            for i, vector_results in zip(misses, vector_batch):
+                text_results = self.search_text(queries[i], k * 2)
+                batch_results[i] = self._combine_results(
+                    cache_keys[i], k, alpha, vector_results, text_results
+                )
         
+        return batch_results
+    
+    async def hybrid_search_async(
+        self, query: str, k: int = 10, alpha: float = 0.5,
+        vector_search: Optional[Callable[[str, int], Awaitable[List[Dict[str, any]]]]] = None
+    ) -> List[Dict[str, any]]:
+        """hybrid_search with the vector and text searches running concurrently
+
+        vector_search(query, k) may route the vector half elsewhere, e.g.
+        through a batcher; by default search_vector runs in a worker thread.
+        """
+        cache_key = self._hybrid_cache_key(query, k, alpha)
+        cached = await asyncio.to_thread(self._cache_get, cache_key)
+        if cached is not None:
+            return orjson.loads(cached)
+        
+        if vector_search is None:
+            vector_search = lambda q, n: asyncio.to_thread(self.search_vector, q, n)
+        vector_results, text_results = await asyncio.gather(
+            vector_search(query, k * 2),
+            asyncio.to_thread(self.search_text, query, k * 2)
+        )
+        
+        return await asyncio.to_thread(
+            self._combine_results, cache_key, k, alpha, vector_results, text_results
+        )
+    
+    def _hybrid_cache_key(self, query: str, k: int, alpha: float) -> bytes:
+        return b"hyb:" + self._cache_version + b":" + hashlib.blake2b(
+            orjson.dumps([query, k, alpha]), digest_size=16
+        ).digest()
+    
+    def _combine_results(self, cache_key: bytes, k: int, alpha: float,
+                         vector_results: List[Dict[str, any]],
+                         text_results: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        """Merge vector and text scores, keep the top k and cache them"""
         # Combine results
         combined_scores = {}
-        all_terms = set()
         
         # Process vector results
         for result in vector_results:
             term = result['term']
-            all_terms.add(term)
             combined_scores[term] = alpha * result['score']
         
         # Process text results
         for result in text_results:
             term = result['term']
-            all_terms.add(term)
             if term in combined_scores:
                 combined_scores[term] += (1 - alpha) * result['score']
             else:
                 combined_scores[term] = (1 - alpha) * result['score']
         
+        # Pick the top k before copying any term records
+        state = self._state
+        scored_terms = [
+            (term, score) for term, score in combined_scores.items()
+            if term in state.term_index
+        ]
+        top_terms = heapq.nlargest(k, scored_terms, key=lambda x: x[1])
+        
         # Create final results
         final_results = []
-        for term in all_terms:
-            term_data = next((t for t in self.terms_data if t['term'] == term), None)
-            if term_data:
-                result = term_data.copy()
-                result['score'] = combined_scores[term]
-                final_results.append(result)
+        for term, score in top_terms:
+            result = state.terms_table.record(state.term_index[term])
+            result['score'] = score
+            final_results.append(result)
         
-        # Sort by score
-        final_results.sort(key=lambda x: x['score'], reverse=True)
-        
-        return final_results[:k]
+        self._cache_set(cache_key, orjson.dumps(final_results), self.RESULT_CACHE_TTL)
+        return final_results
     
     def save(self):
         """Save database to disk"""
-        # Save Faiss index
-        if self.faiss_index is not None:
-            faiss.write_index(self.faiss_index, str(self.db_path / "faiss.index"))
+        state = self._state
+        # Save Faiss index (renamed into place, other workers may have it mapped)
+        if state.faiss_index is not None:
+            _replace_file(self.db_path / "faiss.index",
+                          lambda path: faiss.write_index(state.faiss_index, str(path)))
         
         # Save terms data
-        with open(self.db_path / "terms_data.pkl", 'wb') as f:
-            pickle.dump(self.terms_data, f)
+        state.terms_table.save(self.db_path)
         
         # Save metadata
         metadata = {
-            'num_terms': len(self.terms_data),
+            'num_terms': len(state.terms_table),
             'vector_dim': self.vector_dim
         }
         with open(self.db_path / "metadata.json", 'w', encoding='utf-8') as f:
@@ -239,22 +771,60 @@ class TermDatabase:
     def load(self):
         """Load database from disk"""
         try:
-            # Load Faiss index
-            faiss_path = self.db_path / "faiss.index"
-            if faiss_path.exists():
-                self.faiss_index = faiss.read_index(str(faiss_path))
-            
-            # Load terms data
-            terms_path = self.db_path / "terms_data.pkl"
-            if terms_path.exists():
-                with open(terms_path, 'rb') as f:
-                    self.terms_data = pickle.load(f)
+            with self._write_lock:
+                state = self._state
+                # Load Faiss index. Faiss memory-maps only the inverted lists of
+                # IVF indexes (databases of IVFPQ_MIN_TERMS terms or more), whose
+                # pages workers then share; HNSW indexes are read into each
+                # process in full
+                faiss_path = self.db_path / "faiss.index"
+                if faiss_path.exists():
+                    faiss_index = faiss.read_index(
+                        str(faiss_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                    )
+                    self._set_search_params(faiss_index)
+                    state = replace(
+                        state, faiss_index=faiss_index,
+                        faiss_index_mapped=faiss.try_extract_index_ivf(faiss_index) is not None
+                    )
+                
+                # Load terms data
+                legacy_path = self.db_path / "terms_data.pkl"
+                terms_table = None
+                if TermsTable.exists(self.db_path):
+                    terms_table = TermsTable.load(self.db_path)
+                elif legacy_path.exists():
+                    # Databases saved before the column store hold a list of dicts
+                    with open(legacy_path, 'rb') as f:
+                        terms_table = TermsTable.from_records(pickle.load(f))
+                if terms_table is not None:
+                    state = replace(state, terms_table=terms_table,
+                                    term_index=self._build_term_index(terms_table))
+                self._state = state
+                
+                if terms_table is not None:
+                    self._backfill_fts_index()
+                    self._invalidate_results()
             
-            logger.info(f"Loaded database with {len(self.terms_data)} terms")
+            logger.info(f"Loaded database with {len(self.terms_table)} terms")
             
         except Exception as e:
             logger.error(f"Error loading database: {e}")
     
     def get_all_terms(self) -> List[Dict[str, any]]:
         """Get all terms in database"""
-        return self.terms_data.copy()
\ No newline at end of file
+        return list(self.terms_table.records())
+    
+    def get_terms(self, offset: int = 0, limit: int = 100,
+                  category: Optional[str] = None) -> List[Dict[str, any]]:
+        """Get one page of terms, optionally filtered by category"""
+        terms_table = self.terms_table
+        if category:
+            indexes = [i for i, c in enumerate(terms_table.categories) if c == category]
+        else:
+            indexes = range(len(terms_table))
+        return list(terms_table.records(indexes[offset:offset + limit]))
+    
+    def category_counts(self) -> Counter:
+        """Number of terms per category"""
+        return Counter(self.terms_table.categories)
@@ -0,0 +1,662 @@
+"""
+Lightweight construction term dictionary shared by the minimal, enhanced and
+simple API profiles (see term_extractor/app.py). Pure Python, no NLP models.
+"""
+import asyncio
+import csv
+import functools
+import hashlib
+import io
+import logging
+import os
+import re
+from collections import OrderedDict, ChainMap, Counter
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Dict, Iterable, Iterator, Tuple
+
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to per-term substring checks
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; the stdlib engine is always available
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# Regex engine for the fused patterns: "re" (default) or "re2" (linear-time DFA)
+REGEX_ENGINE = os.environ.get("TERM_EXTRACTOR_REGEX_ENGINE", "re")
+if REGEX_ENGINE == "re2" and re2 is None:
+    logger.warning("google-re2 is not installed, using the re module")
+    REGEX_ENGINE = "re"
+
+# Persistent storage for custom terms
+TERMS_STORAGE_FILE = "custom_terms.json"
+
+# Built-in construction term dictionary
+DEFAULT_CONSTRUCTION_TERMS = {
+    "鉄筋コンクリート": {"aliases": ["RC", "鉄コン"], "category": "構造"},
+    "プレストレストコンクリート": {"aliases": ["PC"], "category": "構造"},
+    "鉄骨鉄筋コンクリート": {"aliases": ["SRC"], "category": "構造"},
+    "基礎工事": {"aliases": ["基礎"], "category": "施工"},
+    "躯体工事": {"aliases": ["躯体"], "category": "施工"},
+    "仕上工事": {"aliases": ["仕上げ"], "category": "施工"},
+    "空調設備": {"aliases": ["空調", "エアコン"], "category": "設備"},
+    "給排水設備": {"aliases": ["給排水"], "category": "設備"},
+    "電気設備": {"aliases": ["電気"], "category": "設備"},
+    "品質管理": {"aliases": ["品質"], "category": "管理"},
+    "安全管理": {"aliases": ["安全"], "category": "管理"},
+    "施工管理": {"aliases": ["施工"], "category": "管理"},
+    "耐震構造": {"aliases": ["耐震"], "category": "構造"},
+    "免震構造": {"aliases": ["免震"], "category": "構造"},
+    "制震構造": {"aliases": ["制震"], "category": "構造"},
+}
+
+# Read-only view of the built-in terms; only custom terms are mutated and persisted
+_DEFAULT_TERMS = MappingProxyType(DEFAULT_CONSTRUCTION_TERMS)
+_CUSTOM_TERMS = {}
+
+# Combined dictionary (custom terms shadow built-ins, nothing is copied)
+CONSTRUCTION_TERMS = ChainMap(_CUSTOM_TERMS, _DEFAULT_TERMS)
+
+# Indexes derived from the dictionary; rebuilt lazily after it changes
+_TERMS, _CATEGORIES, _CONFS = (), (), ()
+_MIN_TERM_LEN = 0
+_TERM_AUTOMATON = None
+_TERMS_BY_FIRST_CHAR = {}
+_SEARCH_INDEX = []
+_SEARCH_NGRAMS = {}
+_INDEX_DIRTY = True
+# Bumped on every dictionary change; part of the result cache key
+_DICT_VERSION = 0
+# Terms per category, recounted only after the dictionary changes
+_CATEGORY_COUNTS = None
+
+
+def _invalidate_term_index():
+    """Mark the dictionary indexes as stale"""
+    global _INDEX_DIRTY, _DICT_VERSION, _CATEGORY_COUNTS
+    _INDEX_DIRTY = True
+    _DICT_VERSION += 1
+    _CATEGORY_COUNTS = None
+
+
+def category_counts() -> Counter:
+    """Number of terms per category (do not mutate the returned Counter)"""
+    global _CATEGORY_COUNTS
+    if _CATEGORY_COUNTS is None:
+        _CATEGORY_COUNTS = Counter(info["category"] for info in CONSTRUCTION_TERMS.values())
+    return _CATEGORY_COUNTS
+
+
+def _ensure_term_index():
+    """Rebuild the dictionary indexes if needed"""
+    global _TERMS, _CATEGORIES, _CONFS, _MIN_TERM_LEN
+    global _TERM_AUTOMATON, _TERMS_BY_FIRST_CHAR, _SEARCH_INDEX, _SEARCH_NGRAMS, _INDEX_DIRTY
+    if _INDEX_DIRTY:
+        _TERMS, _CATEGORIES, _CONFS = _build_flat_index()
+        _MIN_TERM_LEN = min(map(len, _TERMS), default=0)
+        _TERM_AUTOMATON = _build_term_automaton(_TERMS)
+        _TERMS_BY_FIRST_CHAR = _build_first_char_index(_TERMS) if _TERM_AUTOMATON is None else {}
+        _SEARCH_INDEX = _build_search_index()
+        _SEARCH_NGRAMS = _build_search_ngrams(_SEARCH_INDEX)
+        _INDEX_DIRTY = False
+
+
+def _build_flat_index():
+    """Flatten terms and aliases into parallel (term, category, confidence) tuples"""
+    terms, categories, confidences = [], [], []
+    seen = set()
+    for term, info in CONSTRUCTION_TERMS.items():
+        words = [(term, 0.95)] + [(alias, 0.85) for alias in info["aliases"]]
+        for word, confidence in words:
+            # Duplicate strings keep the first dictionary entry
+            if word and word not in seen:
+                seen.add(word)
+                terms.append(word)
+                categories.append(info["category"])
+                confidences.append(confidence)
+    return tuple(terms), tuple(categories), tuple(confidences)
+
+
+def _build_term_automaton(terms):
+    """Build one Aho-Corasick automaton over all terms and aliases"""
+    if ahocorasick is None or not terms:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for i, word in enumerate(terms):
+        # Payload is the position in the flat index (dictionary order)
+        automaton.add_word(word, i)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_first_char_index(terms):
+    """Group flat index positions by the first character of each term"""
+    by_first_char = {}
+    for i, word in enumerate(terms):
+        by_first_char.setdefault(word[0], []).append(i)
+    return by_first_char
+
+
+def _build_search_index():
+    """Build the casefolded term/alias list used by search"""
+    search_index = []
+    for term, info in CONSTRUCTION_TERMS.items():
+        search_index.append((term.casefold(), {
+            "term": term,
+            "confidence": 0.95,
+            "category": info["category"]
+        }))
+        for alias in info["aliases"]:
+            search_index.append((alias.casefold(), {
+                "term": alias,
+                "confidence": 0.85,
+                "category": info["category"]
+            }))
+    return search_index
+
+
+def _ngrams(text: str):
+    """Unigrams of a single character, bigrams otherwise"""
+    if len(text) == 1:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _build_search_ngrams(search_index):
+    """Map every unigram and bigram of the search keys to search index positions"""
+    ngrams = {}
+    for i, (key, _) in enumerate(search_index):
+        for gram in set(key) | _ngrams(key):
+            ngrams.setdefault(gram, set()).add(i)
+    return ngrams
+
+
+def load_custom_terms():
+    """Load custom terms from the storage file"""
+    try:
+        storage_path = Path(TERMS_STORAGE_FILE)
+        if storage_path.exists():
+            custom_terms = orjson.loads(storage_path.read_bytes())
+            _CUSTOM_TERMS.update(custom_terms)
+            _invalidate_term_index()
+            logger.info(f"Loaded {len(custom_terms)} custom terms")
+    except Exception as e:
+        logger.error(f"Failed to load custom terms: {e}")
+
+
+def _write_custom_terms(custom_terms: Dict):
+    """Write custom terms to the storage file"""
+    try:
+        Path(TERMS_STORAGE_FILE).write_bytes(
+            orjson.dumps(custom_terms, option=orjson.OPT_INDENT_2)
+        )
+        logger.info(f"Saved {len(custom_terms)} custom terms")
+    except Exception as e:
+        logger.error(f"Failed to save custom terms: {e}")
+
+
+# Save coalescing: requests arriving mid-write trigger a single follow-up write
+_SAVE_REQUESTED = False
+_SAVE_RUNNING = False
+
+
+async def save_custom_terms():
+    """Save custom terms to the storage file (written in a worker thread)"""
+    global _SAVE_REQUESTED, _SAVE_RUNNING
+    _SAVE_REQUESTED = True
+    if _SAVE_RUNNING:
+        return
+
+    _SAVE_RUNNING = True
+    try:
+        while _SAVE_REQUESTED:
+            _SAVE_REQUESTED = False
+            # Snapshot on the event loop thread so the writer never sees concurrent changes
+            await asyncio.to_thread(_write_custom_terms, dict(_CUSTOM_TERMS))
+    finally:
+        _SAVE_RUNNING = False
+
+
+def iter_text_terms(lines: Iterable[str]) -> Iterator[Dict]:
+    """Parse terms from text file lines"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Supported formats:
+        # 1. term
+        # 2. term|category
+        # 3. term|category|alias1,alias2
+        parts = line.split('|')
+
+        term = parts[0].strip()
+        category = parts[1].strip() if len(parts) > 1 else "一般"
+        aliases = [a.strip() for a in parts[2].split(',')] if len(parts) > 2 else []
+
+        if term:
+            yield {
+                "term": term,
+                "category": category,
+                "aliases": aliases
+            }
+
+
+def parse_text_file(content: str) -> List[Dict]:
+    """Parse terms from text file content"""
+    return list(iter_text_terms(content.split('\n')))
+
+
+def iter_csv_terms(stream: Iterable[str]) -> Iterator[Dict]:
+    """Parse terms from CSV rows; raises ValueError on malformed CSV"""
+    try:
+        reader = csv.DictReader(stream)
+
+        for row in reader:
+            # Accepted column names
+            term = (row.get('term') or row.get('术语') or
+                   row.get('專門用語') or row.get('名称') or "").strip()
+
+            category = (row.get('category') or row.get('分类') or
+                       row.get('カテゴリ') or row.get('類別') or "一般").strip()
+
+            aliases_str = (row.get('aliases') or row.get('别名') or
+                          row.get('エイリアス') or row.get('別稱') or "")
+
+            aliases = [a.strip() for a in aliases_str.split(',') if a.strip()]
+
+            if term:
+                yield {
+                    "term": term,
+                    "category": category,
+                    "aliases": aliases
+                }
+
+    except UnicodeDecodeError:
+        raise
+    except Exception as e:
+        raise ValueError(f"CSV解析错误: {e}") from e
+
+
+def parse_csv_file(content: str) -> List[Dict]:
+    """Parse terms from CSV file content"""
+    return list(iter_csv_terms(io.StringIO(content)))
+
+
+def iter_markdown_terms(lines: Iterable[str]) -> Iterator[Dict]:
+    """Parse terms from Markdown lines (headings are categories)"""
+    current_category = "一般"
+
+    for line in lines:
+        line = line.strip()
+
+        # Headings set the category
+        if line.startswith('#'):
+            current_category = line.lstrip('#').strip()
+            continue
+
+        # List items are terms
+        if line.startswith('-') or line.startswith('*'):
+            term_line = line.lstrip('-*').strip()
+
+            # Format: - term (alias1, alias2)
+            if '(' in term_line and ')' in term_line:
+                term = term_line.split('(')[0].strip()
+                aliases_part = term_line.split('(')[1].split(')')[0]
+                aliases = [a.strip() for a in aliases_part.split(',')]
+            else:
+                term = term_line
+                aliases = []
+
+            if term:
+                yield {
+                    "term": term,
+                    "category": current_category,
+                    "aliases": aliases
+                }
+
+        # Table rows
+        elif '|' in line and not line.startswith('|---'):
+            parts = [p.strip() for p in line.split('|')]
+            if len(parts) >= 3:  # at least term and category columns
+                term = parts[1] if len(parts) > 1 else ""
+                category = parts[2] if len(parts) > 2 else current_category
+                aliases_str = parts[3] if len(parts) > 3 else ""
+                aliases = [a.strip() for a in aliases_str.split(',') if a.strip()]
+
+                if term and term != "术语":
+                    yield {
+                        "term": term,
+                        "category": category,
+                        "aliases": aliases
+                    }
+
+
+def parse_markdown_file(content: str) -> List[Dict]:
+    """Parse terms from Markdown file content"""
+    return list(iter_markdown_terms(content.split('\n')))
+
+
+def _insert_term(term: str, category: str, aliases: List[str] = None) -> bool:
+    """Insert a custom term without touching the indexes"""
+    if term in CONSTRUCTION_TERMS:
+        return False
+    _CUSTOM_TERMS[term] = {
+        "category": category,
+        "aliases": aliases if aliases is not None else []
+    }
+    return True
+
+
+def add_term_to_dictionary(term: str, category: str, aliases: List[str] = None) -> bool:
+    """Add a custom term; returns False if it already exists"""
+    if _insert_term(term, category, aliases):
+        _invalidate_term_index()
+        return True
+    return False
+
+
+def is_default_term(term: str) -> bool:
+    """Whether term is a built-in term"""
+    return term in _DEFAULT_TERMS
+
+
+def term_counts() -> Tuple[int, int]:
+    """Number of built-in and custom terms"""
+    return len(_DEFAULT_TERMS), len(_CUSTOM_TERMS)
+
+
+def bulk_add_terms(items: Iterable[Dict]) -> Tuple[List[str], List[str]]:
+    """Add parsed terms in one batch; returns (added, skipped) term names.
+
+    The terms are staged and merged into the dictionary in one update and the
+    indexes are invalidated once. If items raises part-way (e.g. a decode or
+    CSV error), nothing is added. Like every dictionary change, this must run
+    on the event loop thread.
+    """
+    staged, skipped = {}, []
+    for item in items:
+        term = item["term"]
+        if term in CONSTRUCTION_TERMS or term in staged:
+            skipped.append(term)
+        else:
+            staged[term] = {"category": item["category"], "aliases": item["aliases"]}
+    if staged:
+        _CUSTOM_TERMS.update(staged)
+        _invalidate_term_index()
+    return list(staged), skipped
+
+
+def delete_custom_term(term: str) -> bool:
+    """Delete a custom term; built-in terms cannot be deleted"""
+    if term in _CUSTOM_TERMS:
+        del _CUSTOM_TERMS[term]
+        _invalidate_term_index()
+        return True
+    return False
+
+
+# ASCII abbreviation pattern; skipped entirely for texts without ASCII uppercase
+ABBREVIATION_PATTERN = r'[A-Z]{2,}'
+_has_ascii_upper = re.compile(r'[A-Z]').search
+
+# Regex patterns (pattern, category, confidence)
+TERM_PATTERNS = [
+    (r'[ァ-ヴー]{3,}', "カタカナ", 0.7),  # Katakana terms
+    (r'[一-龯]{2,}(?:工事|施工|構造|材料|設備|管理)', "建築専門", 0.9),  # Construction terms
+    (ABBREVIATION_PATTERN, "略語", 0.8),  # Abbreviations
+    (r'\d+(?:級|種|号|型|㎜|cm|m|階)', "規格", 0.8),  # Specs and dimensions
+    (r'[一-龯]{2,}[性度率量値]', "性能", 0.6),  # Performance terms
+]
+
+
+def _compile(pattern: str):
+    """Compile a fused pattern with the configured regex engine"""
+    if REGEX_ENGINE == "re2":
+        # RE2's \d is ASCII-only; \p{Nd} keeps re's Unicode digits (e.g. full-width)
+        return re2.compile(pattern.replace(r'\d', r'\p{Nd}'))
+    return re.compile(pattern)
+
+
+# Only patterns above the threshold are fused into one named-group regex,
+# so the text is scanned once
+@functools.lru_cache(maxsize=None)
+def _fused_pattern(enabled: tuple):
+    """Compile the fused regex for a set of pattern indexes (cached per set)"""
+    return _compile("|".join(
+        f"(?P<g{i}>{TERM_PATTERNS[i][0]})" for i in enabled
+    ))
+
+
+_PATTERN_META = [(category, confidence) for _, category, confidence in TERM_PATTERNS]
+_CONFIDENCES = tuple(confidence for _, confidence in _PATTERN_META)
+_ABBREVIATION_INDEXES = frozenset(
+    i for i, (pattern, _, _) in enumerate(TERM_PATTERNS) if pattern == ABBREVIATION_PATTERN
+)
+
+
+def _enabled_patterns(text: str, confidences: tuple, abbreviation_indexes: frozenset,
+                      min_confidence: float = 0.0) -> tuple:
+    """Indexes of the patterns worth running on text"""
+    skip = () if _has_ascii_upper(text) else abbreviation_indexes
+    return tuple(i for i, confidence in enumerate(confidences)
+                 if confidence >= min_confidence and i not in skip)
+
+
+# LRU cache for extract/search results; keys carry the dictionary version so
+# stale entries stop matching once the dictionary changes
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_SIZE = 4096
+_CACHE_KEY_TEXT_LIMIT = 256
+
+
+def _cache_key(kind: str, text: str, *params):
+    """Build a cache key (long texts are replaced by a blake2b digest)"""
+    if len(text) > _CACHE_KEY_TEXT_LIMIT:
+        text = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), len(text))
+    return (kind, text, *params, _DICT_VERSION)
+
+
+def _cache_get(key):
+    """Look up a cached result"""
+    result = _RESULT_CACHE.get(key)
+    if result is not None:
+        _RESULT_CACHE.move_to_end(key)
+    return result
+
+
+def _cache_put(key, result: List[dict]) -> tuple:
+    """Store a result in the cache"""
+    result = tuple(result)
+    _RESULT_CACHE[key] = result
+    if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _copy_result(result: tuple) -> List[dict]:
+    """Copy cached term dicts so callers cannot modify the cache or the search index"""
+    return [dict(term) for term in result]
+
+
+def _extract_terms(text: str, min_confidence: float) -> List[dict]:
+    """Dictionary + pattern term extraction (uncached)"""
+    found_terms = []
+    seen_terms = set()
+
+    # 1. Known terms (texts shorter than the shortest term cannot match)
+    _ensure_term_index()
+    if len(text) < _MIN_TERM_LEN:
+        hits = []
+    elif _TERM_AUTOMATON is not None:
+        # One pass over the text finds every term and alias
+        hits = sorted({i for _, i in _TERM_AUTOMATON.iter(text)})
+    else:
+        # Without pyahocorasick only terms whose first character occurs in the
+        # text are checked with a substring search. str search already runs
+        # CPython's fastsearch over the compact (UCS-2 for CJK) form; encoding
+        # the text to UTF-8 and searching bytes measured slower, not faster
+        first_chars = _TERMS_BY_FIRST_CHAR.keys() & set(text)
+        hits = sorted(i for ch in first_chars for i in _TERMS_BY_FIRST_CHAR[ch]
+                      if _TERMS[i] in text)
+
+    for i in hits:
+        seen_terms.add(_TERMS[i])
+        found_terms.append({
+            "term": _TERMS[i],
+            "confidence": _CONFS[i],
+            "category": _CATEGORIES[i]
+        })
+
+    # 2. Pattern matching (patterns below the threshold, and the abbreviation
+    #    pattern on texts without ASCII uppercase, are skipped)
+    enabled = _enabled_patterns(
+        text, _CONFIDENCES, _ABBREVIATION_INDEXES, min_confidence
+    )
+    if enabled:
+        for m in _fused_pattern(enabled).finditer(text):
+            if (match := m.group()) in seen_terms or len(match) < 2:
+                continue
+            category, confidence = _PATTERN_META[int(m.lastgroup[1:])]
+            seen_terms.add(match)
+            found_terms.append({
+                "term": match,
+                "confidence": confidence,
+                "category": category
+            })
+
+    # 3. Confidence filter
+    return [term for term in found_terms if term["confidence"] >= min_confidence]
+
+
+def _search_terms(query: str, limit: int) -> List[dict]:
+    """Search terms and aliases (uncached)"""
+    _ensure_term_index()
+    query_folded = query.casefold()
+    if not query_folded:
+        return []
+
+    # Keys containing the query must contain all of its n-grams; intersect the
+    # posting sets, then confirm the candidates with a substring check
+    candidates = None
+    for gram in _ngrams(query_folded):
+        postings = _SEARCH_NGRAMS.get(gram)
+        if not postings:
+            return []
+        candidates = postings if candidates is None else candidates & postings
+
+    results = [_SEARCH_INDEX[i][1] for i in sorted(candidates)
+               if query_folded in _SEARCH_INDEX[i][0]]
+
+    return results[:limit]
+
+
+# Single-slot cache in front of the LRU for repeated calls with the same text
+# (client retries, re-rendering); held as one tuple so it is replaced atomically
+_LAST_EXTRACT = (None, ())
+
+
+def extract_terms_minimal(text: str, min_confidence: float = 0.5) -> List[dict]:
+    """Extract construction terms from text"""
+    global _LAST_EXTRACT
+    last_key = (text, min_confidence, _DICT_VERSION)
+    cached_key, result = _LAST_EXTRACT
+    if cached_key == last_key:
+        return _copy_result(result)
+
+    key = _cache_key("extract", text, min_confidence)
+    result = _cache_get(key)
+    if result is None:
+        result = _cache_put(key, _extract_terms(text, min_confidence))
+    _LAST_EXTRACT = (last_key, result)
+    return _copy_result(result)
+
+
+def search_terms(query: str, limit: int = 10) -> List[dict]:
+    """Search the term dictionary"""
+    key = _cache_key("search", query, limit)
+    result = _cache_get(key)
+    if result is None:
+        result = _cache_put(key, _search_terms(query, limit))
+    return _copy_result(result)
+
+
+WARMUP_TEXT = "鉄筋コンクリート RC 基礎工事 3級 耐震性"
+
+
+def warmup():
+    """Build the indexes and compile every fused pattern before the first request"""
+    _ensure_term_index()
+    for text in (WARMUP_TEXT, WARMUP_TEXT.lower()):
+        # One fused regex per confidence threshold, with and without the abbreviation pattern
+        for min_confidence in sorted(set(_CONFIDENCES)):
+            _fused_pattern(_enabled_patterns(
+                text, _CONFIDENCES, _ABBREVIATION_INDEXES, min_confidence
+            ))
+        _simple_fused_pattern(_enabled_patterns(
+            text, _SIMPLE_CONFIDENCES, _SIMPLE_ABBREVIATION_INDEXES
+        ))
+    _extract_terms(WARMUP_TEXT, 0.0)
+    _search_terms("RC", 1)
+
+
+def clear_caches():
+    """Drop compiled patterns and cached results (e.g. after switching REGEX_ENGINE)"""
+    global _LAST_EXTRACT
+    _fused_pattern.cache_clear()
+    _simple_fused_pattern.cache_clear()
+    _RESULT_CACHE.clear()
+    _LAST_EXTRACT = (None, ())
+
+
+# Regex-only extraction used by the simple profile (pattern, confidence)
+SIMPLE_TERM_PATTERNS = [
+    (r'[ァ-ヴ]{3,}', 0.8),  # Katakana terms
+    (r'[一-龯]{2,}(?:工事|施工|構造|材料|設備|管理)', 0.9),  # Construction terms
+    (ABBREVIATION_PATTERN, 0.7),  # Abbreviations
+    (r'\d+(?:級|種|号|型)', 0.8),  # Classifications
+]
+
+_SIMPLE_CONFIDENCES = tuple(confidence for _, confidence in SIMPLE_TERM_PATTERNS)
+_SIMPLE_ABBREVIATION_INDEXES = frozenset(
+    i for i, (pattern, _) in enumerate(SIMPLE_TERM_PATTERNS) if pattern == ABBREVIATION_PATTERN
+)
+
+
+# Fuse the patterns into one alternation so the text is scanned only once
+@functools.lru_cache(maxsize=None)
+def _simple_fused_pattern(enabled: tuple):
+    """Compile the fused regex for a set of simple pattern indexes"""
+    return _compile("|".join(
+        f"(?P<g{i}>{SIMPLE_TERM_PATTERNS[i][0]})" for i in enabled
+    ))
+
+
+def simple_extract_terms(text: str) -> List[dict]:
+    """Simple term extraction using regex patterns"""
+    terms = []
+    seen = set()
+
+    enabled = _enabled_patterns(text, _SIMPLE_CONFIDENCES, _SIMPLE_ABBREVIATION_INDEXES)
+    for m in _simple_fused_pattern(enabled).finditer(text):
+        confidence = SIMPLE_TERM_PATTERNS[int(m.lastgroup[1:])][1]
+        match = m.group()
+        if match not in seen and len(match) >= 2:
+            seen.add(match)
+            terms.append({
+                'term': match,
+                'confidence': confidence
+            })
+
+    return terms
+
+
+warmup()
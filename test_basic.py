@@ -109,7 +109,6 @@ def test_configuration():
         "sudachipy",
         "faiss-cpu",
         "sentence-transformers",
-        "whoosh",
         "fastapi",
         "uvicorn"
     ]
@@ -1,14 +1,15 @@
-import asyncio
+import heapq
 from pathlib import Path
 import logging
-from term_extractor.core.pdf_extractor import PDFTermExtractor
+import os
+from term_extractor.core.pdf_extractor import PDFTermExtractor, term_rank_key
 from term_extractor.core.term_database import TermDatabase
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-async def test_extraction():
+def test_extraction():
     """Test term extraction functionality"""
     
     # Initialize components
@@ -24,9 +25,10 @@ async def test_extraction():
     耐震性能はS造（鉄骨造）と同等以上を確保します。
     """
     
-    # Extract terms
+    # Extract terms (line by line)
     logger.info("Extracting terms from test text...")
-    terms = extractor.extract_terms_from_text(test_text)
+    lines = (line for line in test_text.splitlines() if line.strip())
+    terms = list(extractor.iter_terms(lines))
     
     logger.info(f"Found {len(terms)} terms:")
     for term in terms[:10]:  # Show first 10
@@ -37,19 +39,19 @@ async def test_extraction():
         logger.info("\nBuilding term database...")
         db.build_from_terms(terms)
         
-        # Test search
+        # Test search (all queries encoded in one batch)
         test_queries = ["コンクリート", "設備", "施工"]
+        batch_results = db.hybrid_search_batch(test_queries, k=5)
         
-        for query in test_queries:
+        for query, results in zip(test_queries, batch_results):
             logger.info(f"\nSearching for '{query}':")
             
             # Hybrid search
-            results = db.hybrid_search(query, k=5)
             for result in results:
                 logger.info(f"  - {result['term']} (score: {result['score']:.3f})")
 
 
-async def test_pdf_extraction(pdf_folder: str):
+def test_pdf_extraction(pdf_folder: str):
     """Test PDF extraction if folder provided"""
     folder = Path(pdf_folder)
     if not folder.exists():
@@ -59,14 +61,14 @@ async def test_pdf_extraction(pdf_folder: str):
     extractor = PDFTermExtractor()
     db = TermDatabase()
     
-    logger.info(f"Extracting terms from PDFs in {pdf_folder}...")
-    terms = extractor.extract_terms_from_pdfs(folder)
+    logger.info(f"Extracting terms from PDFs in {pdf_folder} ({os.cpu_count()} workers)...")
+    terms = extractor.extract_terms_from_pdfs(folder, max_workers=os.cpu_count(), sort=False)
     
     logger.info(f"Extracted {len(terms)} unique terms")
     
-    # Show top terms by frequency
+    # Show top terms by frequency (partial sort, the database needs no order)
     logger.info("\nTop 10 terms by frequency:")
-    for term in terms[:10]:
+    for term in heapq.nlargest(10, terms, key=term_rank_key):
         logger.info(f"  - {term['term']} (freq: {term['frequency']}, conf: {term['confidence']:.2f})")
     
     # Build and save database
@@ -80,7 +82,7 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1:
         # Test with PDF folder
-        asyncio.run(test_pdf_extraction(sys.argv[1]))
+        test_pdf_extraction(sys.argv[1])
     else:
         # Test with sample text
-        asyncio.run(test_extraction())
\ No newline at end of file
+        test_extraction()
\ No newline at end of file
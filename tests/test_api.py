@@ -1,10 +1,15 @@
 import unittest
+import functools
 import json
-import sys
-import os
+import mmap
+import re
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@functools.lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Read a source file once per test process"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 class TestAPIEndpoints(unittest.TestCase):
@@ -21,12 +26,11 @@ class TestAPIEndpoints(unittest.TestCase):
         ]
         
         # Since we can't import without dependencies, just check file content
-        with open("term_extractor/api/routes.py", "r") as f:
-            content = f.read()
-            
-        for route in expected_routes:
-            self.assertIn(f'@router.post("{route}"', content + f'@router.get("{route}"',
-                         f"Route {route} not found in routes.py")
+        content = _read("term_extractor/api/routes.py")
+        
+        declared = set(re.findall(r'@router\.(?:get|post|put|delete)\("([^"]+)"', content))
+        missing = set(expected_routes) - declared
+        self.assertFalse(missing, f"Routes not found in routes.py: {missing}")
     
     def test_api_models_structure(self):
         """Test API model definitions exist"""
@@ -42,12 +46,11 @@ class TestAPIEndpoints(unittest.TestCase):
             "DatabaseInfo"
         ]
         
-        with open("term_extractor/api/models.py", "r") as f:
-            content = f.read()
-            
-        for model in required_models:
-            self.assertIn(f"class {model}", content,
-                         f"Model {model} not found in models.py")
+        content = _read("term_extractor/api/models.py")
+        
+        defined = set(re.findall(r'^class\s+(\w+)', content, re.M))
+        missing = set(required_models) - defined
+        self.assertFalse(missing, f"Models not found in models.py: {missing}")
 
 
 class TestMainApp(unittest.TestCase):
@@ -55,9 +58,8 @@ class TestMainApp(unittest.TestCase):
     
     def test_main_app_structure(self):
         """Test main.py structure"""
-        with open("main.py", "r") as f:
-            content = f.read()
-            
+        content = _read("main.py")
+        
         # Check required imports
         self.assertIn("from fastapi import FastAPI", content)
         self.assertIn("import uvicorn", content)
@@ -92,18 +94,14 @@ class TestIntegration(unittest.TestCase):
             "hybrid_search"
         ]
         
-        # Check all components exist
-        with open("term_extractor/core/pdf_extractor.py", "r") as f:
-            pdf_content = f.read()
-        
-        with open("term_extractor/core/term_database.py", "r") as f:
-            db_content = f.read()
-            
-        all_content = pdf_content + db_content
+        # Check all components exist (searched in the mapped files, no copies)
+        missing = set(workflow_steps)
+        for path in ("term_extractor/core/pdf_extractor.py",
+                     "term_extractor/core/term_database.py"):
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                missing = {step for step in missing if mm.find(step.encode()) < 0}
         
-        for step in workflow_steps:
-            self.assertIn(step, all_content,
-                         f"Workflow component {step} not found")
+        self.assertFalse(missing, f"Workflow components not found: {missing}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,50 @@
+import unittest
+import asyncio
+
+from term_extractor.api.batching import VectorSearchBatcher
+
+
+class TestVectorSearchBatcher(unittest.TestCase):
+    """Test cases for coalescing concurrent vector searches"""
+
+    def test_concurrent_searches_share_one_batch(self):
+        """Test that concurrent callers are served by a single batch call"""
+        calls = []
+
+        def search_batch(queries, k):
+            calls.append((list(queries), k))
+            return [[{'term': f"{q}{i}"} for i in range(k)] for q in queries]
+
+        batcher = VectorSearchBatcher(search_batch, max_batch_size=8, max_delay=0.01)
+
+        async def run():
+            return await asyncio.gather(
+                batcher.search("a", 1),
+                batcher.search("b", 3),
+            )
+
+        a, b = asyncio.run(run())
+        self.assertEqual(calls, [(["a", "b"], 3)])
+        self.assertEqual([r['term'] for r in a], ["a0"])
+        self.assertEqual([r['term'] for r in b], ["b0", "b1", "b2"])
+
+    def test_errors_reach_every_caller(self):
+        """Test that a failing batch raises in all waiting callers"""
+        def search_batch(queries, k):
+            raise RuntimeError("index not ready")
+
+        batcher = VectorSearchBatcher(search_batch, max_batch_size=2)
+
+        async def run():
+            return await asyncio.gather(
+                batcher.search("a", 1),
+                batcher.search("b", 1),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,27 +1,63 @@
 import unittest
 from unittest.mock import Mock, patch
-import sys
-import os
+import re
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+try:
+    from term_extractor.core import pdf_extractor
+except ImportError:  # pdfplumber / sudachipy not installed
+    pdf_extractor = None
+
+
+# Patterns from pdf_extractor.py, fused into one alternation; the group name
+# of a match identifies the pattern
+TERM_PATTERN = re.compile(
+    r'(?P<g0>[ァ-ヴ]{3,})'  # Katakana terms (3+ chars)
+    r'|(?P<g1>[一-龯]{2,}(?:工事|施工|構造|材料|設備|管理))'  # Kanji + construction suffix
+    r'|(?P<g2>[A-Z]{2,})'  # Abbreviations (RC, PC, etc.)
+    r'|(?P<g3>\d+[級種号型])'  # Numbered classifications
+)
+PATTERN_INDEX = {f"g{i}": i for i in range(4)}
+
+# Keywords from pdf_extractor.py
+CONSTRUCTION_KEYWORDS = frozenset({
+    '工事', '施工', '構造', '材料', '設備', '管理', '基礎', '躯体',
+    '仕上げ', '配管', '配線', '防水', '断熱', '耐震', '免震', '制震',
+    '鉄筋', 'コンクリート', '鋼材', '木材', '石材', 'タイル', 'ガラス',
+    '建築', '土木', '設計', '監理', '検査', '試験', '品質', '安全'
+})
+
+# Categories from term_database.py, checked in order
+CATEGORIES = {
+    '構造': frozenset({'鉄筋', 'コンクリート', '鉄骨', '基礎', '柱', '梁', '耐震'}),
+    '設備': frozenset({'空調', '給排水', '電気', '配管', '配線', '消防'}),
+    '仕上げ': frozenset({'塗装', 'タイル', 'クロス', '床', '天井', '壁'}),
+    '材料': frozenset({'セメント', '鋼材', '木材', '石材', 'ガラス'}),
+    '施工': frozenset({'工事', '施工', '工程', '現場', '作業'}),
+    '管理': frozenset({'品質', '安全', '工程', '検査', '試験'}),
+}
+CATEGORY_NAMES = tuple(CATEGORIES)
 
 
 class TestPDFExtractor(unittest.TestCase):
     """Test cases for PDF term extraction"""
     
+    @classmethod
+    def setUpClass(cls):
+        # All keywords are matched in one scan of each term
+        cls.keyword_automaton = None
+        if ahocorasick is not None:
+            cls.keyword_automaton = ahocorasick.Automaton()
+            for keyword in CONSTRUCTION_KEYWORDS:
+                cls.keyword_automaton.add_word(keyword, keyword)
+            cls.keyword_automaton.make_automaton()
+    
     def test_term_patterns(self):
         """Test regular expression patterns for term extraction"""
-        import re
-        
-        # Patterns from pdf_extractor.py
-        term_patterns = [
-            r'[ァ-ヴ]{3,}',  # Katakana terms (3+ chars)
-            r'[一-龯]{2,}[工事|施工|構造|材料|設備|管理]',  # Kanji + construction suffix
-            r'[A-Z]{2,}',  # Abbreviations (RC, PC, etc.)
-            r'\d+[級|種|号|型]',  # Numbered classifications
-        ]
-        
         test_cases = [
             ("コンクリート", True, 0),  # Katakana
             ("基礎工事", True, 1),  # Kanji + suffix
@@ -31,27 +67,19 @@ class TestPDFExtractor(unittest.TestCase):
         ]
         
         for text, should_match, pattern_idx in test_cases:
-            matched = False
-            for idx, pattern in enumerate(term_patterns):
-                if re.search(pattern, text):
-                    matched = True
-                    if should_match:
-                        self.assertEqual(idx, pattern_idx, 
-                                       f"'{text}' matched wrong pattern")
-                    break
-            
-            self.assertEqual(matched, should_match, 
-                           f"'{text}' match result incorrect")
+            with self.subTest(text=text):
+                match = TERM_PATTERN.search(text)
+                matched = match is not None
+                if matched and should_match:
+                    self.assertEqual(PATTERN_INDEX[match.lastgroup], pattern_idx,
+                                   f"'{text}' matched wrong pattern")
+                
+                self.assertEqual(matched, should_match, 
+                               f"'{text}' match result incorrect")
     
+    @unittest.skipUnless(ahocorasick, "pyahocorasick not installed")
     def test_construction_keywords(self):
         """Test construction keyword detection"""
-        construction_keywords = {
-            '工事', '施工', '構造', '材料', '設備', '管理', '基礎', '躯体',
-            '仕上げ', '配管', '配線', '防水', '断熱', '耐震', '免震', '制震',
-            '鉄筋', 'コンクリート', '鋼材', '木材', '石材', 'タイル', 'ガラス',
-            '建築', '土木', '設計', '監理', '検査', '試験', '品質', '安全'
-        }
-        
         test_terms = [
             ("基礎工事", True),
             ("耐震構造", True),
@@ -61,7 +89,7 @@ class TestPDFExtractor(unittest.TestCase):
         ]
         
         for term, should_contain in test_terms:
-            contains_keyword = any(keyword in term for keyword in construction_keywords)
+            contains_keyword = next(self.keyword_automaton.iter(term), None) is not None
             self.assertEqual(contains_keyword, should_contain,
                            f"'{term}' keyword detection incorrect")
 
@@ -69,32 +97,45 @@ class TestPDFExtractor(unittest.TestCase):
 class TestTermDatabase(unittest.TestCase):
     """Test cases for term database functionality"""
     
-    def test_alias_generation(self):
-        """Test alias generation for terms"""
-        abbreviation_map = {
+    @classmethod
+    def setUpClass(cls):
+        # keyword -> index of the first category listing it
+        keyword_categories = {}
+        for i, keywords in enumerate(CATEGORIES.values()):
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword, i)
+        
+        cls.category_automaton = None
+        if ahocorasick is not None:
+            cls.category_automaton = ahocorasick.Automaton()
+            for keyword, i in keyword_categories.items():
+                cls.category_automaton.add_word(keyword, i)
+            cls.category_automaton.make_automaton()
+        
+        # Abbreviations from term_database.py and their reverse index
+        cls.abbreviation_map = {
             '鉄筋コンクリート': ['RC', '鉄コン'],
             'プレストレストコンクリート': ['PC'],
             '鉄骨鉄筋コンクリート': ['SRC'],
             '空調設備': ['空調', 'エアコン', 'AC'],
             '給排水設備': ['給排水'],
         }
-        
+        cls.alias_to_canonical = {
+            alias: term
+            for term, aliases in cls.abbreviation_map.items()
+            for alias in aliases
+        }
+    
+    def test_alias_generation(self):
+        """Test alias generation for terms"""
         # Test known abbreviations
-        self.assertIn('RC', abbreviation_map['鉄筋コンクリート'])
-        self.assertIn('PC', abbreviation_map['プレストレストコンクリート'])
-        self.assertIn('SRC', abbreviation_map['鉄骨鉄筋コンクリート'])
+        self.assertEqual(self.alias_to_canonical['RC'], '鉄筋コンクリート')
+        self.assertEqual(self.alias_to_canonical['PC'], 'プレストレストコンクリート')
+        self.assertEqual(self.alias_to_canonical['SRC'], '鉄骨鉄筋コンクリート')
     
+    @unittest.skipUnless(ahocorasick, "pyahocorasick not installed")
     def test_term_categorization(self):
         """Test term categorization logic"""
-        categories = {
-            '構造': ['鉄筋', 'コンクリート', '鉄骨', '基礎', '柱', '梁', '耐震'],
-            '設備': ['空調', '給排水', '電気', '配管', '配線', '消防'],
-            '仕上げ': ['塗装', 'タイル', 'クロス', '床', '天井', '壁'],
-            '材料': ['セメント', '鋼材', '木材', '石材', 'ガラス'],
-            '施工': ['工事', '施工', '工程', '現場', '作業'],
-            '管理': ['品質', '安全', '工程', '検査', '試験']
-        }
-        
         test_cases = [
             ("鉄筋工事", '構造'),
             ("空調設備", '設備'),
@@ -103,18 +144,78 @@ class TestTermDatabase(unittest.TestCase):
         ]
         
         for term, expected_category in test_cases:
-            found_category = None
-            for category, keywords in categories.items():
-                for keyword in keywords:
-                    if keyword in term:
-                        found_category = category
-                        break
-                if found_category:
-                    break
+            # One scan finds every keyword; the earliest category wins
+            hit = min((i for _, i in self.category_automaton.iter(term)), default=None)
+            found_category = CATEGORY_NAMES[hit] if hit is not None else None
             
             self.assertEqual(found_category, expected_category,
                            f"'{term}' categorized incorrectly")
 
 
+@unittest.skipUnless(pdf_extractor, "PDF extractor dependencies are not installed")
+class TestTextChunking(unittest.TestCase):
+    """Test cases for splitting long text before tokenization"""
+    
+    def assert_chunks(self, text, max_bytes):
+        chunks = list(pdf_extractor.PDFTermExtractor._iter_chunks(text, max_bytes))
+        self.assertEqual(''.join(chunks), text)
+        for chunk in chunks:
+            self.assertLessEqual(len(chunk.encode('utf-8')), max_bytes)
+        return chunks
+    
+    def test_chunks_rejoin_to_input(self):
+        """Test that chunks cover the text and stay within the byte limit"""
+        text = "基礎工事を行う。\n鉄筋コンクリートを打設する。空調設備\n" * 5000
+        chunks = self.assert_chunks(text, pdf_extractor.MAX_TOKENIZE_BYTES)
+        self.assertGreater(len(chunks), 1)
+        # Splits fall on sentence boundaries
+        for chunk in chunks[:-1]:
+            self.assertIn(chunk[-1], "。\n")
+    
+    def test_sentence_longer_than_limit(self):
+        """Test that a single over-long sentence is split by characters"""
+        text = "短文。" + "鉄" * 100 + "。終わり"
+        chunks = self.assert_chunks(text, 64)
+        self.assertGreater(len(chunks), 2)
+        
+        text = "コンクリート" * 10000
+        self.assert_chunks(text, pdf_extractor.MAX_TOKENIZE_BYTES)
+    
+    def test_extract_over_tokenizer_limit(self):
+        """Test extraction from text longer than Sudachi accepts in one call"""
+        text = "鉄筋コンクリートの基礎工事を行う。" * 2000
+        self.assertGreater(len(text.encode('utf-8')), 49149)
+        terms = pdf_extractor.PDFTermExtractor().extract_terms_from_text(text)
+        self.assertIn('基礎工事', {t['term'] for t in terms})
+
+
+@unittest.skipUnless(pdf_extractor, "PDF extractor dependencies are not installed")
+class TestKatakanaCount(unittest.TestCase):
+    """Test cases for the katakana character count used in confidence scoring"""
+    
+    def test_matches_character_scan(self):
+        """Test that both count paths agree with a per-character range check"""
+        long_text = "コンクリート打設、ー記号とヴ。abc" * 10
+        self.assertGreaterEqual(len(long_text), pdf_extractor._KATAKANA_NUMPY_MIN_LEN)
+        test_cases = [
+            "",
+            "コンクリート",
+            "ァ",  # first character of the range
+            "ヴ",  # last character of the range
+            "ー",  # prolonged sound mark, outside the range
+            "ヵヶ・",  # after ヴ
+            "ぁあ",  # hiragana
+            "鉄筋コンクリートRC構造",
+            "ｺﾝｸﾘｰﾄ",  # half-width katakana
+            long_text,
+            "ー" * 200,
+        ]
+        
+        for text in test_cases:
+            with self.subTest(text=text[:20]):
+                expected = sum(1 for c in text if 'ァ' <= c <= 'ヴ')
+                self.assertEqual(pdf_extractor._count_katakana(text), expected)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
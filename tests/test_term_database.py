@@ -0,0 +1,51 @@
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+try:
+    from term_extractor.core import term_database
+except ImportError:  # torch / sentence_transformers not installed
+    term_database = None
+
+
+@unittest.skipUnless(term_database, "term database dependencies are not installed")
+class TestTermDatabaseLoad(unittest.TestCase):
+    """Test cases for loading saved term databases"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name)
+        # Loading never encodes; skip downloading the sentence transformer
+        patcher = patch.object(term_database, "get_encoder")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_legacy_pickle_is_text_searchable(self):
+        """Test that loading a terms_data.pkl database fills the full-text index"""
+        records = [
+            {'id': 0, 'term': '空調設備', 'aliases': ['空調', 'AC'], 'category': '設備',
+             'confidence': 0.8, 'frequency': 2, 'context': ''},
+            {'id': 1, 'term': '基礎工事', 'aliases': [], 'category': '構造',
+             'confidence': 0.7, 'frequency': 1, 'context': ''},
+        ]
+        with open(self.db_path / "terms_data.pkl", 'wb') as f:
+            pickle.dump(records, f)
+
+        db = term_database.TermDatabase(self.db_path)
+        db.load()
+
+        results = db.search_text('空調設備')
+        self.assertEqual([r['term'] for r in results], ['空調設備'])
+        self.assertEqual(db.search_text('AC')[0]['term'], '空調設備')
+
+        # Loading again does not index the terms twice
+        reloaded = term_database.TermDatabase(self.db_path)
+        reloaded.load()
+        self.assertEqual(len(reloaded.search_text('基礎工事')), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
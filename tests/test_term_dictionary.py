@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import patch
+
+from term_extractor.core import term_dictionary
+
+
+class TestTermDictionary(unittest.TestCase):
+    """Test cases for the lightweight term dictionary"""
+
+    def tearDown(self):
+        term_dictionary._CUSTOM_TERMS.clear()
+        term_dictionary._invalidate_term_index()
+
+    def test_extract_known_terms(self):
+        """Test dictionary and pattern extraction"""
+        text = "RC構造で耐震性能を確保し、品質管理を徹底します。"
+        terms = {t["term"]: t for t in term_dictionary.extract_terms_minimal(text)}
+
+        self.assertEqual(terms["RC"]["category"], "構造")
+        self.assertEqual(terms["品質管理"]["confidence"], 0.95)
+        self.assertEqual(terms["耐震性"]["category"], "性能")
+
+    def test_min_confidence(self):
+        """Test that low-confidence terms are filtered"""
+        text = "RC構造で耐震性能を確保"
+        terms = term_dictionary.extract_terms_minimal(text, 0.9)
+        self.assertTrue(all(t["confidence"] >= 0.9 for t in terms))
+
+    def test_search(self):
+        """Test case-insensitive search over terms and aliases"""
+        results = term_dictionary.search_terms("rc", 10)
+        self.assertIn("RC", [r["term"] for r in results])
+        self.assertEqual(len(term_dictionary.search_terms("施工", 1)), 1)
+        self.assertEqual(term_dictionary.search_terms("", 10), [])
+        self.assertEqual(term_dictionary.search_terms("xyz", 10), [])
+        self.assertEqual([r["term"] for r in term_dictionary.search_terms("ンクリ", 10)],
+                         ["鉄筋コンクリート", "プレストレストコンクリート", "鉄骨鉄筋コンクリート"])
+
+    def test_cached_results_are_copies(self):
+        """Test that modifying a returned result leaves the caches intact"""
+        text = "RC構造で耐震性能を確保"
+        term_dictionary.extract_terms_minimal(text)[0]["term"] = "XX"
+        self.assertNotIn("XX", [t["term"] for t in term_dictionary.extract_terms_minimal(text)])
+
+        term_dictionary.search_terms("RC", 1)[0]["term"] = "XX"
+        self.assertEqual(term_dictionary.search_terms("RC", 1)[0]["term"], "RC")
+        self.assertEqual(term_dictionary.search_terms("RC", 2)[0]["term"], "RC")
+
+    def test_add_and_delete_custom_term(self):
+        """Test that custom terms are picked up by extraction"""
+        text = "型枠を組み立てる"
+        self.assertNotIn("型枠", [t["term"] for t in term_dictionary.extract_terms_minimal(text)])
+
+        default_count, _ = term_dictionary.term_counts()
+        self.assertTrue(term_dictionary.add_term_to_dictionary("型枠", "施工"))
+        self.assertFalse(term_dictionary.add_term_to_dictionary("型枠", "施工"))
+        self.assertIn("型枠", [t["term"] for t in term_dictionary.extract_terms_minimal(text)])
+        self.assertEqual(term_dictionary.term_counts(), (default_count, 1))
+        self.assertFalse(term_dictionary.is_default_term("型枠"))
+        self.assertTrue(term_dictionary.is_default_term("鉄筋コンクリート"))
+
+        self.assertTrue(term_dictionary.delete_custom_term("型枠"))
+        self.assertFalse(term_dictionary.delete_custom_term("鉄筋コンクリート"))
+        self.assertNotIn("型枠", [t["term"] for t in term_dictionary.extract_terms_minimal(text)])
+
+    def test_bulk_add_terms(self):
+        """Test batch insertion and rollback on a parse error"""
+        added, skipped = term_dictionary.bulk_add_terms(
+            term_dictionary.iter_text_terms(["型枠|施工", "鉄筋コンクリート|構造", "足場|仮設"])
+        )
+        self.assertEqual(added, ["型枠", "足場"])
+        self.assertEqual(skipped, ["鉄筋コンクリート"])
+        self.assertIn("足場", [t["term"] for t in term_dictionary.extract_terms_minimal("足場を組む")])
+
+        def broken():
+            yield {"term": "鋼管", "category": "材料", "aliases": []}
+            raise ValueError("CSV解析错误")
+
+        with self.assertRaises(ValueError):
+            term_dictionary.bulk_add_terms(broken())
+        self.assertNotIn("鋼管", term_dictionary.CONSTRUCTION_TERMS)
+
+    def test_parsers(self):
+        """Test text, CSV and Markdown term file parsing"""
+        self.assertEqual(
+            term_dictionary.parse_text_file("鉄骨|構造|S\n\n杭"),
+            [{"term": "鉄骨", "category": "構造", "aliases": ["S"]},
+             {"term": "杭", "category": "一般", "aliases": []}]
+        )
+        self.assertEqual(
+            term_dictionary.parse_csv_file('term,category,aliases\n型枠,施工,"かたわく,FW"\n'),
+            [{"term": "型枠", "category": "施工", "aliases": ["かたわく", "FW"]}]
+        )
+        self.assertEqual(
+            term_dictionary.parse_markdown_file("# 仮設\n- 単管 (パイプ)\n| 養生 | 仮設 | ネット |"),
+            [{"term": "単管", "category": "仮設", "aliases": ["パイプ"]},
+             {"term": "養生", "category": "仮設", "aliases": ["ネット"]}]
+        )
+
+    def test_simple_extract(self):
+        """Test regex-only extraction used by the simple profile"""
+        terms = term_dictionary.simple_extract_terms("SRC造 3級 ボルト")
+        self.assertEqual([t["term"] for t in terms], ["SRC", "3級", "ボルト"])
+
+    @unittest.skipIf(term_dictionary.re2 is None, "google-re2 not installed")
+    def test_re2_engine(self):
+        """Test that the re2 engine finds the same terms as re"""
+        text = "RC構造の１０m、3級 コンクリート工事で耐震性能を確保"
+
+        def extract():
+            term_dictionary.clear_caches()
+            return (term_dictionary.extract_terms_minimal(text, 0.0),
+                    term_dictionary.simple_extract_terms(text))
+
+        expected = extract()
+        with patch.object(term_dictionary, "REGEX_ENGINE", "re2"):
+            self.assertEqual(extract(), expected)
+            # The patterns were compiled under re2, not served from a cache
+            self.assertGreater(term_dictionary._fused_pattern.cache_info().misses, 0)
+            self.assertGreater(term_dictionary._simple_fused_pattern.cache_info().misses, 0)
+        term_dictionary.clear_caches()
+
+
+if __name__ == '__main__':
+    unittest.main()